@@ -1,38 +1,174 @@
 import argparse
+import array
+import asyncio
+import atexit
 import concurrent.futures
+import contextlib
+import functools
 import html
 import json
+import operator
 import os
+import queue
 import re
+import socket
 import sys
 import threading
 import time
 import urllib.parse
-import urllib.request
-from http.cookiejar import CookieJar
 from pathlib import Path
 import shutil
 
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CATALOG_BASE = "https://catalogue.smods.ru"
 HOME_URL = f"{CATALOG_BASE}/"
 STEAM_WORKSHOP_BASE = "https://steamcommunity.com"
 STEAMWORKSHOP_DL_HOME = "http://steamworkshop.download/"
 STEAMWORKSHOP_DL_API = "http://steamworkshop.download/online/steamonline.php"
+MODSBASE_BASE = "https://modsbase.com"
 SCRIPT_DIR = Path(__file__).resolve().parent
 DATA_DIR = SCRIPT_DIR / "data"
 CONFIG_PATH = DATA_DIR / "py-config.json"
 GAMES_CACHE_PATH = DATA_DIR / "games-cache.json"
 ZH_NAME_CACHE_PATH = DATA_DIR / "zh-name-cache.json"
+MAX_WORKERS = 32
+MODSBASE_WAIT_SECONDS = 3
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+HTTP_POOL_SIZE = MAX_WORKERS
 
 DEFAULT_CONFIG = {
     "download_dir": str(Path.home() / "Downloads"),
     "timeout": 25,
     "retries": 2,
-    "workers": 3,
+    # 纯网络 I/O 任务，线程数沿用 ThreadPoolExecutor 的默认取值
+    "workers": min(MAX_WORKERS, (os.cpu_count() or 4) + 4),
     "refresh_games_cache": False,
+    "async_io": False,
 }
 
-PRINT_LOCK = threading.Lock()
+# 日志统一进入队列，由后台线程写出；工作线程 put 后立即返回，不争抢输出锁
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_WRITER = {"thread": None, "lock": threading.Lock()}
+_GAMES_CACHE = {"data": None, "mtime": 0}
+_NAME_CACHE = {"data": None, "mtime": 0, "dirty": False, "updates": 0, "timer": None}
+_NAME_CACHE_LOCK = threading.RLock()
+NAME_CACHE_FLUSH_EVERY = 100
+NAME_CACHE_FLUSH_SECONDS = 30.0
+_GAME_INDEX = {"games": None, "by_appid": {}, "by_lower": {}, "by_alias_key": {}}
+# 所有会话共用同一个连接池，保持 keep-alive，避免每个任务重复 TCP/TLS 握手
+HTTP_ADAPTER = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
+_THREAD_LOCAL = threading.local()
+
+_RE_GAME_TILE = re.compile(
+    r'<div class="game-tile-wrapper">.*?<a class="game-hover" href="https?://catalogue\.smods\.ru/game/([^"]+)">.*?'
+    r'<h2 class="game-title">(.*?)</h2>.*?<a class="game-buy-btn" href="https?://store\.steampowered\.com/app/(\d+)',
+    re.I | re.S,
+)
+_RE_CATALOG_ROW = re.compile(
+    r'<h2 class="post-title entry-title">\s*<a href="https?://catalogue\.smods\.ru/archives/(\d+)"[^>]*>(.*?)</a>.*?'
+    r'<a class="skymods-excerpt-btn[^"]*" href="(https?://modsbase\.com/[^"]+)"',
+    re.I | re.S,
+)
+_RE_STEAM_ITEM = re.compile(
+    r'<a[^>]+href="(https?://steamcommunity\.com/sharedfiles/filedetails/\?id=(\d+)[^"]*)"[^>]*>(.*?)</a>',
+    re.I | re.S,
+)
+_RE_GAME_HREF = re.compile(r"https?://catalogue\.smods\.ru/game/(.+)", re.I)
+_RE_STORE_APP_HREF = re.compile(r"https?://store\.steampowered\.com/app/(\d+)", re.I)
+_RE_ARCHIVE_HREF = re.compile(r"https?://catalogue\.smods\.ru/archives/(\d+)", re.I)
+_RE_MODSBASE_HREF = re.compile(r"https?://modsbase\.com/", re.I)
+_RE_STEAM_ITEM_HREF = re.compile(r"https?://steamcommunity\.com/sharedfiles/filedetails/\?id=(\d+)", re.I)
+_RE_HIDDEN_INPUT = re.compile(r"<input[^>]+type=['\"]hidden['\"][^>]*>", re.I | re.S)
+_RE_INPUT_NAME = (re.compile(r'name="([^"]+)"', re.I | re.S), re.compile(r"name='([^']+)'", re.I | re.S))
+_RE_INPUT_VALUE = (re.compile(r'value="([^"]*)"', re.I | re.S), re.compile(r"value='([^']*)'", re.I | re.S))
+_RE_DIRECT_URL = tuple(
+    re.compile(p, re.I | re.S)
+    for p in (
+        r'href="((?:https?:)?//[^"\s]*?/cgi-bin/dl?\.cgi/[^"\s]+)"',
+        r"href='((?:https?:)?//[^'\s]*?/cgi-bin/dl?\.cgi/[^'\s]+)'",
+        r'href="((?:https?:)?//[^"\s]+\.zip(?!\.html)(?:\?[^"\s]*)?)"',
+        r"href='((?:https?:)?//[^'\s]+\.zip(?!\.html)(?:\?[^'\s]*)?)'",
+        r"(?:location\.href|window\.open)\s*\(\s*['\"]((?:https?:)?//[^'\"\s]+)['\"]\s*\)",
+    )
+)
+_RE_MODSBASE_PAGE = re.compile(r"https?://modsbase\.com/.+\.zip\.html", re.I)
+_RE_POST_FORM_ACTION = (
+    re.compile(r"<form[^>]+method=['\"]post['\"][^>]+action=['\"]([^'\"]+)['\"]", re.I | re.S),
+    re.compile(r"<form[^>]+action=['\"]([^'\"]+)['\"][^>]+method=['\"]post['\"]", re.I | re.S),
+)
+_RE_ITEM_APP = re.compile(r"data:\s*\{\s*item:\s*(\d+),\s*app:\s*(\d+)\s*\}", re.I | re.S)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_PCT_ESCAPE = re.compile(r"%[0-9a-f]{2}")
+_RE_NON_ALNUM_CJK = re.compile(r"[^0-9a-z\u4e00-\u9fff]+")
+_RE_CJK_WORD = re.compile(r"[\u4e00-\u9fff]{2,}")
+_RE_LATIN_WORD = re.compile(r"[A-Za-z0-9][A-Za-z0-9 '&:;,+\-.]{2,}")
+_RE_PAREN_CN = re.compile(r"（[^）]*）")
+_RE_FNAME_BAD = re.compile(r'[\\/:*?"<>|]+')
+_RE_CJK_RUN = re.compile(r"[\u4e00-\u9fff]+")
+_RE_CJK_CHAR = re.compile(r"[\u4e00-\u9fff]")
+_RE_PAREN_NAME = re.compile(r"[（(]([^()（）]{1,40})[）)]")
+_RE_CN_NAME_JUNK = re.compile(r"[^0-9A-Za-z\u4e00-\u9fff·\- ]+")
+_RE_LATIN2 = re.compile(r"[A-Za-z]{2,}")
+# 候选中文名中出现这些词，多半是网页片段而非游戏名
+CN_NAME_BAD_TERMS = (
+    "美国东部时间",
+    "东部时间",
+    "太平洋时间",
+    "协调世界时",
+    "维基百科",
+    "百科",
+    "官方网站",
+    "官网",
+    "Steam",
+    "steam",
+    "以下简称",
+    "来源",
+    "中文",
+    "正好",
+    "打到",
+    "为什么",
+    "事件",
+    "教程",
+    "攻略",
+    "下载",
+    "视频",
+    "新闻",
+)
+CN_NAME_SENTENCE_LIKE = (
+    "为什么",
+    "如何",
+    "怎么",
+    "事件",
+    "坍塌",
+    "介绍",
+    "攻略",
+    "下载",
+    "视频",
+    "新闻",
+    "问题",
+    "可以",
+    "支持",
+    "包括",
+)
+_RE_CN_BAD_TERM = re.compile("|".join(map(re.escape, CN_NAME_BAD_TERMS)))
+_RE_CN_SENTENCE_LIKE = re.compile("|".join(map(re.escape, CN_NAME_SENTENCE_LIKE)))
 BANNER_ART = """███████╗████████╗███████╗ █████╗ ███╗   ███╗    ██╗    ██╗ ██████╗ ██████╗ ██╗  ██╗███████╗██╗  ██╗ ██████╗ ██████╗
 ██╔════╝╚══██╔══╝██╔════╝██╔══██╗████╗ ████║    ██║    ██║██╔═══██╗██╔══██╗██║ ██╔╝██╔════╝██║  ██║██╔═══██╗██╔══██╗
 ███████╗   ██║   █████╗  ███████║██╔████╔██║    ██║ █╗ ██║██║   ██║██████╔╝█████╔╝ ███████╗███████║██║   ██║██████╔╝
@@ -68,29 +204,98 @@ def setup_console_utf8():
         pass
 
 
+def _log_writer_loop():
+    while True:
+        item = _LOG_QUEUE.get()
+        if isinstance(item, threading.Event):
+            # flush_log 的同步点：之前入队的内容都已写出
+            sys.stdout.flush()
+            item.set()
+            continue
+        try:
+            sys.stdout.write(item)
+        except UnicodeEncodeError:
+            enc = sys.stdout.encoding or "utf-8"
+            sys.stdout.write(item.encode(enc, errors="replace").decode(enc, errors="replace"))
+        except Exception:
+            pass
+        if _LOG_QUEUE.empty():
+            sys.stdout.flush()
+
+
+def _emit(text: str):
+    if _LOG_WRITER["thread"] is None:
+        with _LOG_WRITER["lock"]:
+            if _LOG_WRITER["thread"] is None:
+                t = threading.Thread(target=_log_writer_loop, name="log-writer", daemon=True)
+                t.start()
+                _LOG_WRITER["thread"] = t
+    _LOG_QUEUE.put(text)
+
+
+def flush_log(timeout: float = 5.0):
+    # 在 input()/退出前调用，保证已入队的日志先于提示符输出
+    if _LOG_WRITER["thread"] is None:
+        return
+    done = threading.Event()
+    _LOG_QUEUE.put(done)
+    done.wait(timeout)
+
+
+atexit.register(flush_log)
+
+
 def log(message: str, level: str = "INFO"):
-    with PRINT_LOCK:
-        print(f"[{level}] {message}")
+    _emit(f"[{level}] {message}\n")
+
+
+def echo(text: str = ""):
+    # 与 log 同一队列输出，保证和日志的先后顺序
+    _emit(f"{text}\n")
+
+
+def prompt(text: str):
+    flush_log()
+    return input(text)
 
 
 def load_json(path: Path):
     if not path.exists():
         return None
     try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         return json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return None
 
 
-def save_json(path: Path, data):
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+def save_json(path: Path, data, compact=False):
+    # compact 用于程序内部缓存文件；配置文件保持缩进便于手工编辑
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+    elif compact:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    # 先写临时文件再原子替换，中途崩溃不会留下半截的缓存/配置
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_config():
     cfg = DEFAULT_CONFIG.copy()
     raw = load_json(CONFIG_PATH)
     if raw is None:
-        print("首次运行程序，跳过配置检查...")
+        echo("首次运行程序，跳过配置检查...")
         return cfg
     cfg.update({k: v for k, v in raw.items() if k in cfg})
     return cfg
@@ -111,17 +316,70 @@ def default_headers(referer=None):
     return headers
 
 
-def new_opener():
-    return urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+def new_session():
+    # 每个任务独立的 Cookie，底层连接池共享
+    session = requests.Session()
+    session.mount("http://", HTTP_ADAPTER)
+    session.mount("https://", HTTP_ADAPTER)
+    return session
+
+
+def thread_session():
+    # 每个工作线程复用一个会话；任务开始时清空 Cookie，避免跨任务串状态
+    session = getattr(_THREAD_LOCAL, "session", None)
+    if session is None:
+        session = _THREAD_LOCAL.session = new_session()
+    else:
+        session.cookies.clear()
+    return session
+
+
+def iter_completed(futures):
+    """按完成顺序产出 future。
+
+    完成回调直接把 future 投递到 SimpleQueue，主线程逐个取出，
+    不像 as_completed 那样每次唤醒都要检查全部未完成的 future。
+    """
+    done_queue = queue.SimpleQueue()
+    for f in futures:
+        f.add_done_callback(done_queue.put)
+    for _ in range(len(futures)):
+        yield done_queue.get()
+
+
+def prewarm_dns(urls, wait: float = 2.0):
+    # 批量任务开始前并行解析一次固定站点，后续各线程的新连接直接命中系统 DNS 缓存
+    hosts = {}
+    for url in urls:
+        parts = urllib.parse.urlsplit(url)
+        if parts.hostname:
+            hosts[parts.hostname] = parts.port or (443 if parts.scheme == "https" else 80)
+    if not hosts:
+        return
 
+    def _resolve(host, port):
+        try:
+            socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except OSError:
+            pass
 
-def http_get(opener, url, timeout, headers=None, retries=0):
+    # 守护线程：解析器无响应时最多等待 wait 秒，也不会拖住进程退出
+    threads = [threading.Thread(target=_resolve, args=item, daemon=True) for item in hosts.items()]
+    for t in threads:
+        t.start()
+    deadline = time.time() + wait
+    for t in threads:
+        t.join(max(0.0, deadline - time.time()))
+
+
+def http_get_bytes(session, url, timeout, headers=None, retries=0):
+    # 返回原始字节：selectolax 可直接解析，省去一次整页解码
     last_error = None
     for i in range(max(0, retries) + 1):
         try:
-            req = urllib.request.Request(url, headers=headers or default_headers())
-            with opener.open(req, timeout=timeout) as resp:
-                return resp.read().decode("utf-8", errors="ignore")
+            resp = session.get(url, headers=headers or default_headers(), timeout=timeout)
+            resp.raise_for_status()
+            return resp.content
         except Exception as e:
             last_error = e
             if i < retries:
@@ -129,14 +387,17 @@ def http_get(opener, url, timeout, headers=None, retries=0):
     raise last_error
 
 
-def http_post(opener, url, timeout, body_dict, headers=None, retries=0):
+def http_get(session, url, timeout, headers=None, retries=0):
+    return http_get_bytes(session, url, timeout, headers, retries=retries).decode("utf-8", errors="ignore")
+
+
+def http_post(session, url, timeout, body_dict, headers=None, retries=0):
     last_error = None
     for i in range(max(0, retries) + 1):
         try:
-            data = urllib.parse.urlencode(body_dict).encode("utf-8")
-            req = urllib.request.Request(url, data=data, headers=headers or default_headers(), method="POST")
-            with opener.open(req, timeout=timeout) as resp:
-                return resp.read().decode("utf-8", errors="ignore")
+            resp = session.post(url, data=body_dict, headers=headers or default_headers(), timeout=timeout)
+            resp.raise_for_status()
+            return resp.content.decode("utf-8", errors="ignore")
         except Exception as e:
             last_error = e
             if i < retries:
@@ -144,21 +405,63 @@ def http_post(opener, url, timeout, body_dict, headers=None, retries=0):
     raise last_error
 
 
-def load_name_cache():
-    obj = load_json(ZH_NAME_CACHE_PATH)
-    return obj if isinstance(obj, dict) else {}
-
-
-def save_name_cache(cache_obj):
-    save_json(ZH_NAME_CACHE_PATH, cache_obj)
+def _file_mtime(path: Path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
 
+def load_name_cache():
+    with _NAME_CACHE_LOCK:
+        mtime = _file_mtime(ZH_NAME_CACHE_PATH)
+        if _NAME_CACHE["data"] is not None and _NAME_CACHE["mtime"] == mtime:
+            return _NAME_CACHE["data"]
+        obj = load_json(ZH_NAME_CACHE_PATH)
+        _NAME_CACHE["data"] = obj if isinstance(obj, dict) else {}
+        _NAME_CACHE["mtime"] = mtime
+        return _NAME_CACHE["data"]
+
+
+def flush_name_cache():
+    with _NAME_CACHE_LOCK:
+        timer = _NAME_CACHE["timer"]
+        _NAME_CACHE["timer"] = None
+        if timer:
+            timer.cancel()
+        if not _NAME_CACHE["dirty"] or _NAME_CACHE["data"] is None:
+            return
+        # 先复制一份，避免其他线程写入时序列化报错
+        save_json(ZH_NAME_CACHE_PATH, dict(_NAME_CACHE["data"]), compact=True)
+        _NAME_CACHE["mtime"] = _file_mtime(ZH_NAME_CACHE_PATH)
+        _NAME_CACHE["dirty"] = False
+        _NAME_CACHE["updates"] = 0
+
+
+def mark_name_cache_dirty():
+    """记录 load_name_cache() 返回的缓存有更新；累计一定条数或超过一定时间后统一写盘。"""
+    with _NAME_CACHE_LOCK:
+        _NAME_CACHE["dirty"] = True
+        _NAME_CACHE["updates"] += 1
+        if _NAME_CACHE["updates"] >= NAME_CACHE_FLUSH_EVERY:
+            flush_name_cache()
+        elif _NAME_CACHE["timer"] is None:
+            timer = threading.Timer(NAME_CACHE_FLUSH_SECONDS, flush_name_cache)
+            timer.daemon = True
+            timer.start()
+            _NAME_CACHE["timer"] = timer
+
+
+atexit.register(flush_name_cache)
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(text: str):
     if not text:
         return ""
     value = text.strip().lower()
-    value = re.sub(r"%[0-9a-f]{2}", " ", value)
-    value = re.sub(r"[^0-9a-z\u4e00-\u9fff]+", "", value)
+    value = _RE_PCT_ESCAPE.sub(" ", value)
+    value = _RE_NON_ALNUM_CJK.sub("", value)
     return value
 
 
@@ -166,9 +469,9 @@ def name_variants(game_name: str, slug: str):
     variants = set()
     if game_name:
         variants.add(game_name.strip())
-        for m in re.finditer(r"[\u4e00-\u9fff]{2,}", game_name):
+        for m in _RE_CJK_WORD.finditer(game_name):
             variants.add(m.group(0))
-        for m in re.finditer(r"[A-Za-z0-9][A-Za-z0-9 '&:;,+\-.]{2,}", game_name):
+        for m in _RE_LATIN_WORD.finditer(game_name):
             variants.add(m.group(0).strip())
     if slug:
         variants.add(slug)
@@ -178,20 +481,39 @@ def name_variants(game_name: str, slug: str):
     return sorted(v for v in variants if v)
 
 
+def _attr(node, name):
+    if node is None:
+        return ""
+    return node.attributes.get(name) or ""
+
+
+def _html_text(body):
+    if isinstance(body, bytes):
+        return body.decode("utf-8", errors="ignore")
+    return body
+
+
+def iter_game_tiles(html_text):
+    if LexborHTMLParser is None:
+        for m in _RE_GAME_TILE.finditer(_html_text(html_text)):
+            yield m.group(1).strip(), html.unescape(_RE_TAG.sub("", m.group(2)).strip()), int(m.group(3))
+        return
+
+    for node in LexborHTMLParser(html_text).css("div.game-tile-wrapper"):
+        slug_m = _RE_GAME_HREF.match(_attr(node.css_first("a.game-hover"), "href"))
+        app_m = _RE_STORE_APP_HREF.match(_attr(node.css_first("a.game-buy-btn"), "href"))
+        title = node.css_first("h2.game-title")
+        if not (slug_m and app_m and title):
+            continue
+        yield slug_m.group(1).strip(), title.text().strip(), int(app_m.group(1))
+
+
 def fetch_supported_games(timeout: int, retries: int = 0):
     log("Fetching supported games from website...", "STEP")
-    opener = new_opener()
-    html_text = http_get(opener, HOME_URL, timeout, default_headers(), retries=retries)
-    pattern = re.compile(
-        r'<div class="game-tile-wrapper">.*?<a class="game-hover" href="https?://catalogue\.smods\.ru/game/([^"]+)">.*?'
-        r'<h2 class="game-title">(.*?)</h2>.*?<a class="game-buy-btn" href="https?://store\.steampowered\.com/app/(\d+)',
-        re.I | re.S,
-    )
+    session = new_session()
+    html_text = http_get_bytes(session, HOME_URL, timeout, default_headers(), retries=retries)
     records = {}
-    for m in pattern.finditer(html_text):
-        appid = int(m.group(3))
-        slug = m.group(1).strip()
-        game_name = html.unescape(re.sub(r"<.*?>", "", m.group(2)).strip())
+    for slug, game_name, appid in iter_game_tiles(html_text):
         records[appid] = {
             "AppId": appid,
             "Slug": slug,
@@ -205,24 +527,65 @@ def fetch_supported_games(timeout: int, retries: int = 0):
         "count": len(games),
         "games": games,
     }
-    save_json(GAMES_CACHE_PATH, payload)
+    save_json(GAMES_CACHE_PATH, payload, compact=True)
     log(f"Games cache saved: {GAMES_CACHE_PATH} (count={len(games)})", "OK")
     return games
 
 
+def prepare_games(games):
+    # 预先计算匹配用字段（下划线开头，不写入缓存文件）
+    for g in games:
+        g["_slug_lower"] = g["Slug"].lower()
+        g["_game_lower"] = g["Game"].lower()
+        g["_alias_keys"] = frozenset(normalize_name(a) for a in g.get("Aliases", []))
+        # 归一化后的别名只含字母数字和汉字，用换行拼接后一次 in 即可完成子串匹配
+        g["_alias_blob"] = "\n".join(g["_alias_keys"])
+        g["_sort_key"] = (g.get("Game", ""), int(g.get("AppId", 0)))
+        # 游戏列表筛选/展示用：中英文名拆分结果与拼接好的匹配文本
+        aliases = g.get("Aliases", [])
+        g["_en"], g["_cn"] = split_game_names(g.get("Game", ""), aliases)
+        g["_cn_blob"] = (g["_cn"] + " " + " ".join(aliases)).strip()
+        g["_slug_decoded"] = urllib.parse.unquote(g.get("Slug", "")).lower()
+        g["_en_blob"] = (g["_en"] + " " + g["_slug_decoded"] + " " + " ".join(str(a) for a in aliases)).lower()
+    return games
+
+
 def load_games(timeout: int, force_refresh=False, retries: int = 0):
     if not force_refresh:
+        mtime = _file_mtime(GAMES_CACHE_PATH)
+        if _GAMES_CACHE["data"] is not None and _GAMES_CACHE["mtime"] == mtime:
+            return _GAMES_CACHE["data"]
         cached = load_json(GAMES_CACHE_PATH)
         if cached and isinstance(cached.get("games"), list) and cached["games"]:
-            return cached["games"]
-    return fetch_supported_games(timeout, retries=retries)
+            _GAMES_CACHE["data"] = prepare_games(cached["games"])
+            _GAMES_CACHE["mtime"] = mtime
+            return _GAMES_CACHE["data"]
+    games = prepare_games(fetch_supported_games(timeout, retries=retries))
+    _GAMES_CACHE["data"] = games
+    _GAMES_CACHE["mtime"] = _file_mtime(GAMES_CACHE_PATH)
+    return games
+
+
+def _game_index(games):
+    # 按列表对象缓存索引，重新加载游戏列表后自动重建；setdefault 保证与顺序扫描一样取第一个匹配
+    if _GAME_INDEX["games"] is not games:
+        by_appid, by_lower, by_alias_key = {}, {}, {}
+        for g in games:
+            by_appid.setdefault(int(g["AppId"]), g)
+            by_lower.setdefault(g["_slug_lower"], g)
+            by_lower.setdefault(g["_game_lower"], g)
+            for k in g["_alias_keys"]:
+                by_alias_key.setdefault(k, g)
+        _GAME_INDEX.update(games=games, by_appid=by_appid, by_lower=by_lower, by_alias_key=by_alias_key)
+    return _GAME_INDEX
 
 
 def resolve_game(games, game=None, appid=None):
+    index = _game_index(games)
     if appid:
-        for g in games:
-            if int(g["AppId"]) == int(appid):
-                return g
+        g = index["by_appid"].get(int(appid))
+        if g:
+            return g
         return {"AppId": int(appid), "Slug": "", "Game": "(Unknown)", "Aliases": []}
 
     if not game:
@@ -235,20 +598,14 @@ def resolve_game(games, game=None, appid=None):
     lower = candidate.lower()
     key = normalize_name(candidate)
 
-    for g in games:
-        if g["Slug"].lower() == lower or g["Game"].lower() == lower:
-            return g
-
-    for g in games:
-        alias_keys = {normalize_name(a) for a in g.get("Aliases", [])}
-        if key in alias_keys:
-            return g
+    g = index["by_lower"].get(lower) or index["by_alias_key"].get(key)
+    if g:
+        return g
 
     for g in games:
-        if lower in g["Slug"].lower() or lower in g["Game"].lower():
+        if lower in g["_slug_lower"] or lower in g["_game_lower"]:
             return g
-        alias_keys = {normalize_name(a) for a in g.get("Aliases", [])}
-        if any(key in alias for alias in alias_keys):
+        if g["_alias_keys"] and key in g["_alias_blob"]:
             return g
 
     raise ValueError(f"无法匹配游戏: {candidate}")
@@ -266,50 +623,65 @@ def get_keywords(keyword=None, list_file=None):
             s = line.strip()
             if s and not s.startswith("#"):
                 tasks.append(s)
-    return tasks
+    # 保序去重：重复的关键词只跑一次完整流程
+    return list(dict.fromkeys(tasks))
 
 
 def clean_keyword(text: str):
     value = (text or "").strip()
-    value = re.sub(r"（[^）]*）", "", value).strip()
+    value = _RE_PAREN_CN.sub("", value).strip()
     return value
 
 
 def normalize_exact_text(text: str):
     value = html.unescape((text or "").strip().lower())
-    value = re.sub(r"\s+", " ", value)
+    value = " ".join(value.split())
     return value
 
 
-def find_catalog_results(opener, search_text: str, timeout: int, appid: int = None, retries: int = 0):
+def iter_catalog_rows(body):
+    if LexborHTMLParser is None:
+        for m in _RE_CATALOG_ROW.finditer(_html_text(body)):
+            yield m.group(1), html.unescape(_RE_TAG.sub("", m.group(2)).strip()), m.group(3)
+        return
+
+    # css() 按文档顺序返回，标题后面第一个 modsbase 按钮即为该条结果的下载页
+    pending = None
+    for node in LexborHTMLParser(body).css("h2.post-title.entry-title > a, a.skymods-excerpt-btn"):
+        href = _attr(node, "href")
+        if node.parent is not None and node.parent.tag == "h2":
+            m = _RE_ARCHIVE_HREF.match(href)
+            if m:
+                pending = (m.group(1), node.text().strip())
+        elif pending and _RE_MODSBASE_HREF.match(href):
+            yield pending[0], pending[1], href
+            pending = None
+
+
+def catalog_search_url(search_text: str, appid: int = None):
     if appid:
-        url = f"{CATALOG_BASE}/?s={urllib.parse.quote(search_text)}&app={appid}"
-    else:
-        url = f"{CATALOG_BASE}/?s={urllib.parse.quote(search_text)}"
-    body = http_get(opener, url, timeout, default_headers(), retries=retries)
-    pattern = re.compile(
-        r'<h2 class="post-title entry-title">\s*<a href="https?://catalogue\.smods\.ru/archives/(\d+)"[^>]*>(.*?)</a>.*?'
-        r'<a class="skymods-excerpt-btn[^"]*" href="(https?://modsbase\.com/[^"]+)"',
-        re.I | re.S,
-    )
-    results = []
-    for m in pattern.finditer(body):
-        results.append(
-            {
-                "ArchiveId": m.group(1),
-                "Title": html.unescape(re.sub(r"<.*?>", "", m.group(2)).strip()),
-                "ModsLink": m.group(3),
-                "SearchUrl": url,
-            }
-        )
-    return results
+        return f"{CATALOG_BASE}/?s={urllib.parse.quote(search_text)}&app={appid}"
+    return f"{CATALOG_BASE}/?s={urllib.parse.quote(search_text)}"
+
+
+def parse_catalog_results(body, url: str):
+    # 惰性生成：调用方找到目标后即可停止，剩余结果不再解析
+    for archive_id, title, mods_link in iter_catalog_rows(body):
+        yield {
+            "ArchiveId": archive_id,
+            "Title": title,
+            "ModsLink": mods_link,
+            "SearchUrl": url,
+        }
 
 
-def find_exact_catalog_result(opener, search_text: str, timeout: int, appid: int = None, retries: int = 0):
-    results = find_catalog_results(opener, search_text, timeout, appid=appid, retries=retries)
-    if not results:
-        return None
+def find_catalog_results(session, search_text: str, timeout: int, appid: int = None, retries: int = 0):
+    url = catalog_search_url(search_text, appid)
+    body = http_get_bytes(session, url, timeout, default_headers(), retries=retries)
+    return parse_catalog_results(body, url)
+
 
+def pick_exact_catalog_result(results, search_text: str):
     key = normalize_exact_text(search_text)
     for row in results:
         if normalize_exact_text(row["Title"]) == key:
@@ -317,11 +689,14 @@ def find_exact_catalog_result(opener, search_text: str, timeout: int, appid: int
     return None
 
 
-def find_catalog_result_by_workshop_id(opener, appid: int, workshop_item_id: str, timeout: int, retries: int = 0):
-    results = find_catalog_results(opener, str(workshop_item_id), timeout, appid=appid, retries=retries)
-    if not results:
-        return None
-    return results[0]
+def find_exact_catalog_result(session, search_text: str, timeout: int, appid: int = None, retries: int = 0):
+    results = find_catalog_results(session, search_text, timeout, appid=appid, retries=retries)
+    return pick_exact_catalog_result(results, search_text)
+
+
+def find_catalog_result_by_workshop_id(session, appid: int, workshop_item_id: str, timeout: int, retries: int = 0):
+    results = find_catalog_results(session, str(workshop_item_id), timeout, appid=appid, retries=retries)
+    return next(results, None)
 
 
 def normalize_direct_url(url: str):
@@ -329,41 +704,32 @@ def normalize_direct_url(url: str):
         return None
     if url.startswith("//"):
         url = "https:" + url
-    if re.search(r"https?://modsbase\.com/.+\.zip\.html", url, re.I):
+    if _RE_MODSBASE_PAGE.search(url):
         return None
     return url
 
 
 def first_match(text: str, patterns):
     for p in patterns:
-        m = re.search(p, text, re.I | re.S)
+        m = p.search(text)
         if m:
             return m.group(1)
     return None
 
 
 def parse_direct_url(html_text: str):
-    candidate = first_match(
-        html_text,
-        [
-            r'href="((?:https?:)?//[^"\s]*?/cgi-bin/dl?\.cgi/[^"\s]+)"',
-            r"href='((?:https?:)?//[^'\s]*?/cgi-bin/dl?\.cgi/[^'\s]+)'",
-            r'href="((?:https?:)?//[^"\s]+\.zip(?!\.html)(?:\?[^"\s]*)?)"',
-            r"href='((?:https?:)?//[^'\s]+\.zip(?!\.html)(?:\?[^'\s]*)?)'",
-            r"(?:location\.href|window\.open)\s*\(\s*['\"]((?:https?:)?//[^'\"\s]+)['\"]\s*\)",
-        ],
-    )
+    candidate = first_match(html_text, _RE_DIRECT_URL)
     return normalize_direct_url(candidate)
 
 
 def parse_hidden_inputs(html_text: str):
     result = {}
-    for m in re.finditer(r"<input[^>]+type=['\"]hidden['\"][^>]*>", html_text, re.I | re.S):
+    for m in _RE_HIDDEN_INPUT.finditer(html_text):
         tag = m.group(0)
-        n = first_match(tag, [r'name="([^"]+)"', r"name='([^']+)'"])
+        n = first_match(tag, _RE_INPUT_NAME)
         if not n:
             continue
-        v = first_match(tag, [r'value="([^"]*)"', r"value='([^']*)'"])
+        v = first_match(tag, _RE_INPUT_VALUE)
         result[n] = v if v is not None else ""
     return result
 
@@ -383,18 +749,22 @@ def build_steam_workshop_search_url(appid: int, search_text: str):
     return f"{STEAM_WORKSHOP_BASE}/workshop/browse/?{urllib.parse.urlencode(params)}"
 
 
-def find_first_steam_workshop_item(opener, appid: int, search_text: str, timeout: int, retries: int = 0):
-    browse_url = build_steam_workshop_search_url(appid, search_text)
-    body = http_get(opener, browse_url, timeout, default_headers(), retries=retries)
+def iter_steam_items(body):
+    if LexborHTMLParser is None:
+        for m in _RE_STEAM_ITEM.finditer(_html_text(body)):
+            yield m.group(1), m.group(2), html.unescape(_RE_TAG.sub("", m.group(3))).strip()
+        return
+
+    for node in LexborHTMLParser(body).css('a[href*="/sharedfiles/filedetails/?id="]'):
+        href = _attr(node, "href")
+        m = _RE_STEAM_ITEM_HREF.match(href)
+        if m:
+            yield href, m.group(1), node.text().strip()
+
+
+def parse_first_steam_workshop_item(body, appid: int, browse_url: str):
     candidates = []
-    pattern = re.compile(
-        r'<a[^>]+href="(https?://steamcommunity\.com/sharedfiles/filedetails/\?id=(\d+)[^"]*)"[^>]*>(.*?)</a>',
-        re.I | re.S,
-    )
-    for m in pattern.finditer(body):
-        href = m.group(1)
-        item_id = m.group(2)
-        title = html.unescape(re.sub(r"<.*?>", "", m.group(3))).strip()
+    for href, item_id, title in iter_steam_items(body):
         if not title or title.lower() in {"learn more", "了解更多"}:
             continue
         candidates.append({"href": href, "item_id": item_id, "title": title})
@@ -409,12 +779,26 @@ def find_first_steam_workshop_item(opener, appid: int, search_text: str, timeout
     return {"ItemId": item_id, "AppId": int(appid), "Title": title, "ItemUrl": item_url, "SearchUrl": browse_url}
 
 
+def find_first_steam_workshop_item(session, appid: int, search_text: str, timeout: int, retries: int = 0):
+    browse_url = build_steam_workshop_search_url(appid, search_text)
+    body = http_get_bytes(session, browse_url, timeout, default_headers(), retries=retries)
+    return parse_first_steam_workshop_item(body, appid, browse_url)
+
+
+def steamworkshop_api_target(first_page: str, item_id: str, appid: int):
+    item_app = _RE_ITEM_APP.search(first_page)
+    target_item = item_app.group(1) if item_app else str(item_id)
+    target_app = int(item_app.group(2)) if item_app else int(appid)
+    referer = f"{STEAMWORKSHOP_DL_HOME.rstrip('/')}/download/view/{target_item}"
+    return {"item": target_item, "app": str(target_app)}, referer
+
+
 def resolve_steamworkshopdownload_url(
-    opener, workshop_item_url: str, item_id: str, appid: int, timeout: int, retries: int = 0
+    session, workshop_item_url: str, item_id: str, appid: int, timeout: int, retries: int = 0
 ):
     headers = default_headers(referer=workshop_item_url)
     first_page = http_post(
-        opener,
+        session,
         STEAMWORKSHOP_DL_HOME,
         timeout,
         {"url": workshop_item_url},
@@ -426,54 +810,48 @@ def resolve_steamworkshopdownload_url(
     if direct:
         return direct
 
-    item_app = re.search(r"data:\s*\{\s*item:\s*(\d+),\s*app:\s*(\d+)\s*\}", first_page, re.I | re.S)
-    target_item = item_app.group(1) if item_app else str(item_id)
-    target_app = int(item_app.group(2)) if item_app else int(appid)
-    referer = f"{STEAMWORKSHOP_DL_HOME.rstrip('/')}/download/view/{target_item}"
-
+    body, referer = steamworkshop_api_target(first_page, item_id, appid)
     second_page = http_post(
-        opener,
+        session,
         STEAMWORKSHOP_DL_API,
         timeout,
-        {"item": target_item, "app": str(target_app)},
+        body,
         headers=default_headers(referer=referer),
         retries=retries,
     )
     return parse_direct_url(second_page)
 
 
-def resolve_direct_download_url(opener, mods_link: str, referer_url: str, timeout: int, retries: int = 0):
-    headers = default_headers(referer=referer_url)
-    first_page = http_get(opener, mods_link, timeout, headers, retries=retries)
-    direct = parse_direct_url(first_page)
-    if direct:
-        return direct
-
-    action = first_match(
-        first_page,
-        [
-            r"<form[^>]+method=['\"]post['\"][^>]+action=['\"]([^'\"]+)['\"]",
-            r"<form[^>]+action=['\"]([^'\"]+)['\"][^>]+method=['\"]post['\"]",
-        ],
-    )
+def modsbase_free_form(first_page: str, mods_link: str):
+    action = first_match(first_page, _RE_POST_FORM_ACTION)
     if not action:
         action = mods_link
     if action.startswith("/"):
-        action = "https://modsbase.com" + action
+        action = MODSBASE_BASE + action
     if action.startswith("//"):
         action = "https:" + action
 
     body = parse_hidden_inputs(first_page)
     if "method_free" not in body:
         body["method_free"] = ""
+    return action, body
+
+
+def resolve_direct_download_url(session, mods_link: str, referer_url: str, timeout: int, retries: int = 0):
+    headers = default_headers(referer=referer_url)
+    first_page = http_get(session, mods_link, timeout, headers, retries=retries)
+    direct = parse_direct_url(first_page)
+    if direct:
+        return direct
 
-    time.sleep(3)
-    second_page = http_post(opener, action, timeout, body, headers, retries=retries)
+    action, body = modsbase_free_form(first_page, mods_link)
+    time.sleep(MODSBASE_WAIT_SECONDS)
+    second_page = http_post(session, action, timeout, body, headers, retries=retries)
     return parse_direct_url(second_page)
 
 
 def safe_filename(text: str):
-    return re.sub(r'[\\/:*?"<>|]+', "_", text)
+    return _RE_FNAME_BAD.sub("_", text)
 
 
 def output_filename(direct_url: str, title: str):
@@ -509,120 +887,239 @@ def format_duration(seconds: float):
     return f"{m:02d}:{s:02d}"
 
 
-def download_file_with_progress(
-    opener, direct_url: str, file_path: Path, timeout: int, label: str = "", progress_hook=None, emit_logs=True
+def report_download_start(tag: str, total_size: int, progress_hook=None):
+    if progress_hook:
+        progress_hook(
+            {
+                "phase": "start",
+                "label": tag,
+                "downloaded": 0,
+                "total_size": total_size,
+                "speed": 0.0,
+                "eta": None,
+                "pct": 0.0,
+            }
+        )
+
+
+def report_download_progress(
+    tag: str, downloaded: int, total_size: int, speed: float, progress_hook=None, emit_logs=True
 ):
-    req = urllib.request.Request(direct_url, headers=default_headers())
-    with opener.open(req, timeout=timeout) as resp, open(file_path, "wb") as f:
-        length_header = resp.headers.get("Content-Length", "")
-        total_size = int(length_header) if str(length_header).isdigit() else 0
-        downloaded = 0
-        start_ts = time.time()
-        last_log_ts = 0.0
-        next_percent_mark = 0.1
-        logged_complete = False
-        chunk_size = 256 * 1024
-        tag = (label or file_path.name or "download")[:48]
-        if progress_hook:
-            progress_hook(
-                {
-                    "phase": "start",
-                    "label": tag,
-                    "downloaded": 0,
-                    "total_size": total_size,
-                    "speed": 0.0,
-                    "eta": None,
-                    "pct": 0.0,
-                }
+    """汇报一次下载进度，返回是否已经输出过 100% 的进度。"""
+    if total_size > 0:
+        pct = min(100.0, downloaded * 100.0 / total_size)
+        remain = max(0, total_size - downloaded)
+        eta = remain / max(1.0, speed)
+        if emit_logs:
+            log(
+                f"{tag} | {pct:5.1f}% | {format_bytes(downloaded)}/{format_bytes(total_size)} | "
+                f"{format_bytes(speed)}/s | ETA {format_duration(eta)}",
+                "PROG",
             )
-
-        while True:
-            chunk = resp.read(chunk_size)
-            if not chunk:
-                break
-            f.write(chunk)
-            downloaded += len(chunk)
-
-            now = time.time()
-            elapsed = max(0.001, now - start_ts)
-            speed = downloaded / elapsed
-            should_log_time = now - last_log_ts >= 1.2
-            should_log_percent = bool(total_size) and (downloaded / total_size) >= next_percent_mark
-            if should_log_time or should_log_percent:
-                if total_size > 0:
-                    pct = min(100.0, downloaded * 100.0 / total_size)
-                    remain = max(0, total_size - downloaded)
-                    eta = remain / max(1.0, speed)
-                    if emit_logs:
-                        log(
-                            f"{tag} | {pct:5.1f}% | {format_bytes(downloaded)}/{format_bytes(total_size)} | "
-                            f"{format_bytes(speed)}/s | ETA {format_duration(eta)}",
-                            "PROG",
-                        )
-                    if progress_hook:
-                        progress_hook(
-                            {
-                                "phase": "downloading",
-                                "label": tag,
-                                "downloaded": downloaded,
-                                "total_size": total_size,
-                                "speed": speed,
-                                "eta": eta,
-                                "pct": pct,
-                            }
-                        )
-                    if pct >= 100.0:
-                        logged_complete = True
-                    while next_percent_mark <= 1.0 and (downloaded / total_size) >= next_percent_mark:
-                        next_percent_mark += 0.1
-                else:
-                    if emit_logs:
-                        log(f"{tag} | {format_bytes(downloaded)} | {format_bytes(speed)}/s | ETA --:--", "PROG")
-                    if progress_hook:
-                        progress_hook(
-                            {
-                                "phase": "downloading",
-                                "label": tag,
-                                "downloaded": downloaded,
-                                "total_size": 0,
-                                "speed": speed,
-                                "eta": None,
-                                "pct": None,
-                            }
-                        )
-                last_log_ts = now
-
-        elapsed = max(0.001, time.time() - start_ts)
-        avg_speed = downloaded / elapsed
         if progress_hook:
             progress_hook(
                 {
-                    "phase": "done",
+                    "phase": "downloading",
                     "label": tag,
                     "downloaded": downloaded,
                     "total_size": total_size,
-                    "speed": avg_speed,
-                    "eta": 0.0,
-                    "pct": 100.0 if total_size > 0 else None,
+                    "speed": speed,
+                    "eta": eta,
+                    "pct": pct,
                 }
             )
-        if total_size > 0 and not logged_complete:
-            if emit_logs:
-                log(
-                    f"{tag} | 100.0% | {format_bytes(downloaded)}/{format_bytes(total_size)} | "
-                    f"{format_bytes(avg_speed)}/s | ETA 00:00",
-                    "PROG",
-                )
-        elif total_size <= 0:
-            if emit_logs:
-                log(f"{tag} | {format_bytes(downloaded)} | {format_bytes(avg_speed)}/s | ETA 00:00", "PROG")
+        return pct >= 100.0
 
+    if emit_logs:
+        log(f"{tag} | {format_bytes(downloaded)} | {format_bytes(speed)}/s | ETA --:--", "PROG")
+    if progress_hook:
+        progress_hook(
+            {
+                "phase": "downloading",
+                "label": tag,
+                "downloaded": downloaded,
+                "total_size": 0,
+                "speed": speed,
+                "eta": None,
+                "pct": None,
+            }
+        )
+    return False
 
-def run_one_task(
-    appid: int, keyword: str, timeout: int, retries: int, only_get_link: bool, out_dir: Path, progress_hook=None
+
+def report_download_done(
+    tag: str,
+    downloaded: int,
+    total_size: int,
+    start_ts: float,
+    logged_complete: bool,
+    progress_hook=None,
+    emit_logs=True,
 ):
-    opener = new_opener()
-    result = {
+    elapsed = max(0.001, time.time() - start_ts)
+    avg_speed = downloaded / elapsed
+    if progress_hook:
+        progress_hook(
+            {
+                "phase": "done",
+                "label": tag,
+                "downloaded": downloaded,
+                "total_size": total_size,
+                "speed": avg_speed,
+                "eta": 0.0,
+                "pct": 100.0 if total_size > 0 else None,
+            }
+        )
+    if total_size > 0 and not logged_complete:
+        if emit_logs:
+            log(
+                f"{tag} | 100.0% | {format_bytes(downloaded)}/{format_bytes(total_size)} | "
+                f"{format_bytes(avg_speed)}/s | ETA 00:00",
+                "PROG",
+            )
+    elif total_size <= 0:
+        if emit_logs:
+            log(f"{tag} | {format_bytes(downloaded)} | {format_bytes(avg_speed)}/s | ETA 00:00", "PROG")
+
+
+def content_length(headers):
+    length_header = headers.get("Content-Length", "")
+    return int(length_header) if str(length_header).isdigit() else 0
+
+
+def download_reporting(progress_hook=None, emit_logs=None):
+    """同步/异步下载共用的汇报判断，返回 (emit_logs, report_chunks)。
+
+    emit_logs 为 None 时按有无进度回调决定：单条下载没有回调，自己输出 PROG 日志。
+    既无回调又不输出日志时无需逐块汇报，可直接整块写入。
+    """
+    if emit_logs is None:
+        emit_logs = progress_hook is None
+    return emit_logs, progress_hook is not None or emit_logs
+
+
+def download_file_with_progress(
+    session, direct_url: str, file_path: Path, timeout: int, label: str = "", progress_hook=None, emit_logs=None
+):
+    emit_logs, report_chunks = download_reporting(progress_hook, emit_logs)
+    with session.get(direct_url, headers=default_headers(), timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        with open(file_path, "wb") as f:
+            total_size = content_length(resp.headers)
+            downloaded = 0
+            start_ts = time.time()
+            next_report_ts = start_ts + 1.0
+            logged_complete = False
+            chunk_size = DOWNLOAD_CHUNK_SIZE
+            tag = (label or file_path.name or "download")[:48]
+            if not report_chunks:
+                # 无需进度时直接整块拷贝
+                resp.raw.decode_content = True
+                shutil.copyfileobj(resp.raw, f, chunk_size)
+                return
+            report_download_start(tag, total_size, progress_hook)
+
+            while True:
+                chunk = resp.raw.read(chunk_size, decode_content=True)
+                if not chunk:
+                    break
+                f.write(chunk)
+                downloaded += len(chunk)
+
+                # 每秒最多汇报一次，其余分块只做写入
+                now = time.time()
+                if now < next_report_ts:
+                    continue
+                next_report_ts = now + 1.0
+                speed = downloaded / max(0.001, now - start_ts)
+                if report_download_progress(tag, downloaded, total_size, speed, progress_hook, emit_logs):
+                    logged_complete = True
+
+            report_download_done(tag, downloaded, total_size, start_ts, logged_complete, progress_hook, emit_logs)
+
+
+def cached_lookup(lookup_cache, key, func, *args, **kwargs):
+    """批次内查询缓存：只记住成功（非 None）的结果，lookup_cache 为 None 时直接查询。"""
+    if lookup_cache is None:
+        return func(*args, **kwargs)
+    value = lookup_cache.get(key)
+    if value is None:
+        value = func(*args, **kwargs)
+        if value is not None:
+            lookup_cache[key] = value
+    return value
+
+
+def resolve_task_link(session, appid, search_text: str, timeout: int, retries: int, lookup_cache=None):
+    """解析关键词对应的直链，返回 (direct, title, workshop_url)。
+
+    lookup_cache 只缓存 Steam / 目录查询；直链总是用当前会话重新解析。
+    """
+    direct = None
+    hit = None
+    title = ""
+    workshop_url = ""
+
+    if appid:
+        steam_item = cached_lookup(
+            lookup_cache,
+            ("steam", appid, search_text),
+            find_first_steam_workshop_item,
+            session,
+            appid,
+            search_text,
+            timeout,
+            retries=retries,
+        )
+        if steam_item:
+            title = steam_item["Title"] or search_text
+            workshop_url = steam_item.get("ItemUrl", "")
+            hit = cached_lookup(
+                lookup_cache,
+                ("workshop", steam_item["AppId"], steam_item["ItemId"]),
+                find_catalog_result_by_workshop_id,
+                session,
+                steam_item["AppId"],
+                steam_item["ItemId"],
+                timeout,
+                retries=retries,
+            )
+            if hit:
+                title = hit["Title"] or title
+                direct = resolve_direct_download_url(
+                    session, hit["ModsLink"], hit["SearchUrl"], timeout, retries=retries
+                )
+
+            if not direct:
+                direct = resolve_steamworkshopdownload_url(
+                    session,
+                    steam_item["ItemUrl"],
+                    steam_item["ItemId"],
+                    steam_item["AppId"],
+                    timeout,
+                    retries=retries,
+                )
+
+    if not direct:
+        hit = cached_lookup(
+            lookup_cache,
+            ("exact", appid, search_text),
+            find_exact_catalog_result,
+            session,
+            search_text,
+            timeout,
+            appid=appid,
+            retries=retries,
+        )
+        if hit:
+            title = hit["Title"] or title or search_text
+            direct = resolve_direct_download_url(session, hit["ModsLink"], hit["SearchUrl"], timeout, retries=retries)
+
+    return direct, title, workshop_url
+
+
+def new_task_result(keyword: str):
+    return {
         "keyword": keyword,
         "ok": False,
         "title": "",
@@ -631,49 +1128,62 @@ def run_one_task(
         "file": "",
         "error": "",
     }
+
+
+def task_file_path(out_dir: Path, direct_url: str, label: str):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir / output_filename(direct_url, label)
+
+
+def download_with_retries(
+    session,
+    direct_url: str,
+    file_path: Path,
+    timeout: int,
+    retries: int,
+    label: str = "",
+    progress_hook=None,
+):
+    last_error = None
+    for i in range(max(0, retries) + 1):
+        try:
+            download_file_with_progress(
+                session=session,
+                direct_url=direct_url,
+                file_path=file_path,
+                timeout=timeout,
+                label=label,
+                progress_hook=progress_hook,
+            )
+            return
+        except Exception as e:
+            last_error = e
+            if i < retries:
+                time.sleep(1)
+    raise last_error
+
+
+def run_one_task(
+    appid: int,
+    keyword: str,
+    timeout: int,
+    retries: int,
+    only_get_link: bool,
+    out_dir: Path,
+    progress_hook=None,
+    lookup_cache=None,
+):
+    session = thread_session()
+    result = new_task_result(keyword)
     try:
         search_text = clean_keyword(keyword)
         if not search_text:
             result["error"] = "Empty keyword"
             return result
 
-        direct = None
-        hit = None
-
-        if appid:
-            steam_item = find_first_steam_workshop_item(opener, appid, search_text, timeout, retries=retries)
-            if steam_item:
-                result["title"] = steam_item["Title"] or search_text
-                result["workshop_url"] = steam_item.get("ItemUrl", "")
-                hit = find_catalog_result_by_workshop_id(
-                    opener,
-                    steam_item["AppId"],
-                    steam_item["ItemId"],
-                    timeout,
-                    retries=retries,
-                )
-                if hit:
-                    result["title"] = hit["Title"] or result["title"]
-                    direct = resolve_direct_download_url(
-                        opener, hit["ModsLink"], hit["SearchUrl"], timeout, retries=retries
-                    )
-
-                if not direct:
-                    direct = resolve_steamworkshopdownload_url(
-                        opener,
-                        steam_item["ItemUrl"],
-                        steam_item["ItemId"],
-                        steam_item["AppId"],
-                        timeout,
-                        retries=retries,
-                    )
-
-        if not direct:
-            hit = find_exact_catalog_result(opener, search_text, timeout, appid=appid, retries=retries)
-            if hit:
-                result["title"] = hit["Title"] or result["title"] or search_text
-                direct = resolve_direct_download_url(opener, hit["ModsLink"], hit["SearchUrl"], timeout, retries=retries)
-
+        direct, result["title"], result["workshop_url"] = resolve_task_link(
+            session, appid, search_text, timeout, retries, lookup_cache
+        )
         if not direct:
             result["error"] = "No exact match or direct URL"
             return result
@@ -683,29 +1193,9 @@ def run_one_task(
             result["ok"] = True
             return result
 
-        out_dir.mkdir(parents=True, exist_ok=True)
-        name = output_filename(direct, result["title"] or search_text)
-        file_path = out_dir / name
-        last_error = None
-        for i in range(max(0, retries) + 1):
-            try:
-                download_file_with_progress(
-                    opener=opener,
-                    direct_url=direct,
-                    file_path=file_path,
-                    timeout=timeout,
-                    label=result["title"] or search_text,
-                    progress_hook=progress_hook,
-                    emit_logs=progress_hook is None,
-                )
-                last_error = None
-                break
-            except Exception as e:
-                last_error = e
-                if i < retries:
-                    time.sleep(1)
-        if last_error:
-            raise last_error
+        label = result["title"] or search_text
+        file_path = task_file_path(out_dir, direct, label)
+        download_with_retries(session, direct, file_path, timeout, retries, label, progress_hook)
         result["file"] = str(file_path)
         result["ok"] = True
         return result
@@ -714,174 +1204,579 @@ def run_one_task(
         return result
 
 
-def run_batch(selected_game, keywords, only_get_link, out_dir, timeout, retries, workers):
+def _aiohttp_timeout(timeout: int):
+    # 与 requests 一致：分别限制连接与单次读取，不限制总时长（大文件下载）
+    return aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+
+async def async_http_get_bytes(session, url, timeout, headers=None, retries=0):
+    last_error = None
+    for i in range(max(0, retries) + 1):
+        try:
+            async with session.get(
+                url, headers=headers or default_headers(), timeout=_aiohttp_timeout(timeout)
+            ) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+        except Exception as e:
+            last_error = e
+            if i < retries:
+                await asyncio.sleep(1)
+    raise last_error
+
+
+async def async_http_get(session, url, timeout, headers=None, retries=0):
+    body = await async_http_get_bytes(session, url, timeout, headers, retries=retries)
+    return body.decode("utf-8", errors="ignore")
+
+
+async def async_http_post(session, url, timeout, body_dict, headers=None, retries=0):
+    last_error = None
+    for i in range(max(0, retries) + 1):
+        try:
+            async with session.post(
+                url, data=body_dict, headers=headers or default_headers(), timeout=_aiohttp_timeout(timeout)
+            ) as resp:
+                resp.raise_for_status()
+                return (await resp.read()).decode("utf-8", errors="ignore")
+        except Exception as e:
+            last_error = e
+            if i < retries:
+                await asyncio.sleep(1)
+    raise last_error
+
+
+async def find_catalog_results_async(session, search_text: str, timeout: int, appid: int = None, retries: int = 0):
+    url = catalog_search_url(search_text, appid)
+    body = await async_http_get_bytes(session, url, timeout, default_headers(), retries=retries)
+    return parse_catalog_results(body, url)
+
+
+async def find_exact_catalog_result_async(session, search_text: str, timeout: int, appid: int = None, retries: int = 0):
+    results = await find_catalog_results_async(session, search_text, timeout, appid=appid, retries=retries)
+    return pick_exact_catalog_result(results, search_text)
+
+
+async def find_catalog_result_by_workshop_id_async(
+    session, appid: int, workshop_item_id: str, timeout: int, retries: int = 0
+):
+    results = await find_catalog_results_async(session, str(workshop_item_id), timeout, appid=appid, retries=retries)
+    return next(results, None)
+
+
+async def find_first_steam_workshop_item_async(session, appid: int, search_text: str, timeout: int, retries: int = 0):
+    browse_url = build_steam_workshop_search_url(appid, search_text)
+    body = await async_http_get_bytes(session, browse_url, timeout, default_headers(), retries=retries)
+    return parse_first_steam_workshop_item(body, appid, browse_url)
+
+
+async def resolve_steamworkshopdownload_url_async(
+    session, workshop_item_url: str, item_id: str, appid: int, timeout: int, retries: int = 0
+):
+    first_page = await async_http_post(
+        session,
+        STEAMWORKSHOP_DL_HOME,
+        timeout,
+        {"url": workshop_item_url},
+        headers=default_headers(referer=workshop_item_url),
+        retries=retries,
+    )
+    direct = parse_direct_url(first_page)
+    if direct:
+        return direct
+
+    body, referer = steamworkshop_api_target(first_page, item_id, appid)
+    second_page = await async_http_post(
+        session,
+        STEAMWORKSHOP_DL_API,
+        timeout,
+        body,
+        headers=default_headers(referer=referer),
+        retries=retries,
+    )
+    return parse_direct_url(second_page)
+
+
+async def resolve_direct_download_url_async(session, mods_link: str, referer_url: str, timeout: int, retries: int = 0):
+    headers = default_headers(referer=referer_url)
+    first_page = await async_http_get(session, mods_link, timeout, headers, retries=retries)
+    direct = parse_direct_url(first_page)
+    if direct:
+        return direct
+
+    action, body = modsbase_free_form(first_page, mods_link)
+    # 异步等待，不阻塞其他任务
+    await asyncio.sleep(MODSBASE_WAIT_SECONDS)
+    second_page = await async_http_post(session, action, timeout, body, headers, retries=retries)
+    return parse_direct_url(second_page)
+
+
+async def download_file_with_progress_async(
+    session, direct_url: str, file_path: Path, timeout: int, label: str = "", progress_hook=None, emit_logs=None
+):
+    emit_logs, report_chunks = download_reporting(progress_hook, emit_logs)
+    async with session.get(direct_url, headers=default_headers(), timeout=_aiohttp_timeout(timeout)) as resp:
+        resp.raise_for_status()
+        with open(file_path, "wb") as f:
+            total_size = content_length(resp.headers)
+            downloaded = 0
+            start_ts = time.time()
+            next_report_ts = start_ts + 1.0
+            logged_complete = False
+            tag = (label or file_path.name or "download")[:48]
+            if not report_chunks:
+                # 无需进度时只写入，不做逐块汇报
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                return
+            report_download_start(tag, total_size, progress_hook)
+
+            async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                downloaded += len(chunk)
+
+                now = time.time()
+                if now < next_report_ts:
+                    continue
+                next_report_ts = now + 1.0
+                speed = downloaded / max(0.001, now - start_ts)
+                if report_download_progress(tag, downloaded, total_size, speed, progress_hook, emit_logs):
+                    logged_complete = True
+
+            report_download_done(tag, downloaded, total_size, start_ts, logged_complete, progress_hook, emit_logs)
+
+
+async def cached_lookup_async(lookup_cache, key, func, *args, **kwargs):
+    """cached_lookup 的协程版本。"""
+    if lookup_cache is None:
+        return await func(*args, **kwargs)
+    value = lookup_cache.get(key)
+    if value is None:
+        value = await func(*args, **kwargs)
+        if value is not None:
+            lookup_cache[key] = value
+    return value
+
+
+async def resolve_task_link_async(session, appid, search_text: str, timeout: int, retries: int, lookup_cache=None):
+    """resolve_task_link 的协程版本。"""
+    direct = None
+    hit = None
+    title = ""
+    workshop_url = ""
+
+    if appid:
+        steam_item = await cached_lookup_async(
+            lookup_cache,
+            ("steam", appid, search_text),
+            find_first_steam_workshop_item_async,
+            session,
+            appid,
+            search_text,
+            timeout,
+            retries=retries,
+        )
+        if steam_item:
+            title = steam_item["Title"] or search_text
+            workshop_url = steam_item.get("ItemUrl", "")
+            hit = await cached_lookup_async(
+                lookup_cache,
+                ("workshop", steam_item["AppId"], steam_item["ItemId"]),
+                find_catalog_result_by_workshop_id_async,
+                session,
+                steam_item["AppId"],
+                steam_item["ItemId"],
+                timeout,
+                retries=retries,
+            )
+            if hit:
+                title = hit["Title"] or title
+                direct = await resolve_direct_download_url_async(
+                    session, hit["ModsLink"], hit["SearchUrl"], timeout, retries=retries
+                )
+
+            if not direct:
+                direct = await resolve_steamworkshopdownload_url_async(
+                    session,
+                    steam_item["ItemUrl"],
+                    steam_item["ItemId"],
+                    steam_item["AppId"],
+                    timeout,
+                    retries=retries,
+                )
+
+    if not direct:
+        hit = await cached_lookup_async(
+            lookup_cache,
+            ("exact", appid, search_text),
+            find_exact_catalog_result_async,
+            session,
+            search_text,
+            timeout,
+            appid=appid,
+            retries=retries,
+        )
+        if hit:
+            title = hit["Title"] or title or search_text
+            direct = await resolve_direct_download_url_async(
+                session, hit["ModsLink"], hit["SearchUrl"], timeout, retries=retries
+            )
+
+    return direct, title, workshop_url
+
+
+async def download_with_retries_async(
+    session,
+    direct_url: str,
+    file_path: Path,
+    timeout: int,
+    retries: int,
+    label: str = "",
+    progress_hook=None,
+):
+    last_error = None
+    for i in range(max(0, retries) + 1):
+        try:
+            await download_file_with_progress_async(
+                session=session,
+                direct_url=direct_url,
+                file_path=file_path,
+                timeout=timeout,
+                label=label,
+                progress_hook=progress_hook,
+            )
+            return
+        except Exception as e:
+            last_error = e
+            if i < retries:
+                await asyncio.sleep(1)
+    raise last_error
+
+
+async def run_one_task_async(
+    connector,
+    appid: int,
+    keyword: str,
+    timeout: int,
+    retries: int,
+    only_get_link: bool,
+    out_dir: Path,
+    progress_hook=None,
+    lookup_cache=None,
+):
+    """与 run_one_task 流程相同；每个任务独立 Cookie，共享 connector 的连接池。"""
+    result = new_task_result(keyword)
+    try:
+        async with aiohttp.ClientSession(connector=connector, connector_owner=False) as session:
+            search_text = clean_keyword(keyword)
+            if not search_text:
+                result["error"] = "Empty keyword"
+                return result
+
+            direct, result["title"], result["workshop_url"] = await resolve_task_link_async(
+                session, appid, search_text, timeout, retries, lookup_cache
+            )
+            if not direct:
+                result["error"] = "No exact match or direct URL"
+                return result
+
+            result["url"] = direct
+            if only_get_link:
+                result["ok"] = True
+                return result
+
+            label = result["title"] or search_text
+            file_path = task_file_path(out_dir, direct, label)
+            await download_with_retries_async(session, direct, file_path, timeout, retries, label, progress_hook)
+            result["file"] = str(file_path)
+            result["ok"] = True
+            return result
+    except Exception as e:
+        result["error"] = str(e)
+        return result
+
+
+async def run_tasks_async(
+    appid,
+    keywords,
+    timeout,
+    retries,
+    only_get_link,
+    out_dir,
+    workers,
+    hook_for,
+    on_result,
+    report=None,
+    report_interval: float = 1.5,
+    lookup_cache=None,
+):
+    """单线程事件循环并发执行任务，workers 限制同时进行的任务数。
+
+    进度回调、结果回调与 report 都在事件循环线程内调用，调用方无需加锁。
+    """
+    sem = asyncio.Semaphore(workers)
+    connector = aiohttp.TCPConnector(limit=workers * 4, ttl_dns_cache=300)
+    reporter = None
+
+    async def _report_loop():
+        while True:
+            await asyncio.sleep(report_interval)
+            report()
+
+    async def _task(kw):
+        async with sem:
+            res = await run_one_task_async(
+                connector,
+                appid,
+                kw,
+                timeout,
+                retries,
+                only_get_link,
+                out_dir,
+                progress_hook=hook_for(kw),
+                lookup_cache=lookup_cache,
+            )
+        return kw, res
+
+    try:
+        if report is not None:
+            reporter = asyncio.create_task(_report_loop())
+        for fut in asyncio.as_completed([_task(kw) for kw in keywords]):
+            kw, res = await fut
+            on_result(kw, res)
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+        await connector.close()
+
+
+# 批量任务进度阶段编码（按任务存放在 bytearray 中）
+TASK_PHASES = {"queued": 0, "start": 1, "downloading": 2, "done": 3, "failed": 4}
+ACTIVE_TASK_PHASES = frozenset((TASK_PHASES["start"], TASK_PHASES["downloading"]))
+
+_TSV_CLEAN = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+
+
+def _tsv(value):
+    # 映射文件字段：制表符/换行替换为空格，保证一行一条
+    return ("" if value is None else str(value)).translate(_TSV_CLEAN).strip()
+
+
+def run_batch(
+    selected_game,
+    keywords,
+    only_get_link,
+    out_dir,
+    timeout,
+    retries,
+    workers,
+    use_async=False,
+    use_cache=True,
+):
     appid = int(selected_game["AppId"]) if selected_game else None
     if selected_game:
         log(f"GAME: {selected_game['Game']} | AppId={appid} | Slug={selected_game.get('Slug', '')}", "GAME")
     else:
         log("MODE: Global search (all games)", "GAME")
+    workers = max(1, min(int(workers), MAX_WORKERS, len(keywords)))
+    if use_async and aiohttp is None:
+        log("未安装 aiohttp，改用线程池执行", "WARN")
+        use_async = False
     log(f"Tasks: {len(keywords)} | Workers: {workers} | Timeout: {timeout}s | Retries: {retries}", "INFO")
     log(f"提示：{EXACT_SEARCH_NOTICE}", "WARN")
 
     results = []
-    progress_lock = threading.Lock()
+    # 本批次内的 Steam / 目录查询缓存（只存成功结果）；重复关键词不再重复查询
+    lookup_cache = {} if use_cache else None
+    # asyncio 模式下所有进度读写都在事件循环线程内，不需要真正的锁
+    progress_lock = contextlib.nullcontext() if use_async else threading.Lock()
     progress_state = {
         "total": len(keywords),
         "completed": 0,
         "success": 0,
         "failed": 0,
-        "tasks": {},
         "offset": 0,
+        # 以下为增量维护的汇总值，渲染时无需遍历全部任务
+        "total_downloaded": 0,
+        "total_known": 0,
+        "active": set(),
     }
-    for kw in keywords:
-        progress_state["tasks"][kw] = {
-            "label": kw[:48],
-            "phase": "queued",
-            "downloaded": 0,
-            "total_size": 0,
-            "speed": 0.0,
-            "eta": None,
-            "updated_at": time.time(),
-        }
+    # 每个任务占一个下标，各字段按列存放在数组里，更新时只做下标写入
+    task_index = {kw: i for i, kw in enumerate(keywords)}
+    task_count = len(keywords)
+    task_label = [kw[:48] for kw in keywords]
+    task_phase = bytearray(task_count)
+    task_downloaded = array.array("q", [0]) * task_count
+    task_total_size = array.array("q", [0]) * task_count
+    task_speed = array.array("d", [0.0]) * task_count
+    task_updated_at = array.array("d", [time.time()]) * task_count
+    task_eta = [None] * task_count
 
     stop_event = threading.Event()
-    reporter_meta = {"last_sig": "", "last_emit_ts": 0.0, "last_done": -1}
+    reporter_meta = {"last_emit_ts": 0.0, "last_done": -1}
 
     def on_progress(kw, payload):
+        idx = task_index.get(kw)
+        if idx is None:
+            return
+        phase = TASK_PHASES.get(payload.get("phase"), task_phase[idx])
+        downloaded = int(payload.get("downloaded") or 0)
+        total_size = max(0, int(payload.get("total_size") or 0))
+        now = time.time()
         with progress_lock:
-            state = progress_state["tasks"].get(kw)
-            if not state:
-                return
-            state["phase"] = payload.get("phase") or state["phase"]
-            state["label"] = payload.get("label") or state["label"]
-            state["downloaded"] = int(payload.get("downloaded") or 0)
-            state["total_size"] = int(payload.get("total_size") or 0)
-            state["speed"] = float(payload.get("speed") or 0.0)
-            state["eta"] = payload.get("eta")
-            state["updated_at"] = time.time()
+            progress_state["total_downloaded"] += downloaded - task_downloaded[idx]
+            progress_state["total_known"] += total_size - task_total_size[idx]
+            task_phase[idx] = phase
+            task_label[idx] = payload.get("label") or task_label[idx]
+            task_downloaded[idx] = downloaded
+            task_total_size[idx] = total_size
+            task_speed[idx] = float(payload.get("speed") or 0.0)
+            task_eta[idx] = payload.get("eta")
+            task_updated_at[idx] = now
+            if phase in ACTIVE_TASK_PHASES:
+                progress_state["active"].add(idx)
+            else:
+                progress_state["active"].discard(idx)
 
     def render_batch_progress(force=False):
+        # 有活动下载时最多每 4 秒输出一次；先不加锁判断，避免与工作线程争锁
+        if (not force) and progress_state["active"] and (
+            time.monotonic() - reporter_meta["last_emit_ts"] < 4.0
+        ):
+            return
+        # 锁内只拷贝快照，格式化与输出放到锁外
         with progress_lock:
             total = progress_state["total"]
             done = progress_state["completed"]
             ok = progress_state["success"]
             fail = progress_state["failed"]
-            tasks = list(progress_state["tasks"].items())
-
-            active = [(k, v) for k, v in tasks if v.get("phase") in {"start", "downloading"}]
-            total_dl = sum(int(v.get("downloaded") or 0) for _, v in tasks)
-            total_known = sum(int(v.get("total_size") or 0) for _, v in tasks if int(v.get("total_size") or 0) > 0)
-            total_speed = sum(float(v.get("speed") or 0.0) for _, v in active)
-            remain_known = max(0, total_known - total_dl)
-            eta = remain_known / total_speed if total_speed > 1 and total_known > 0 else None
-            done_pct = (done * 100.0 / total) if total else 100.0
-
-            if not active:
-                sig = f"{done}|{ok}|{fail}|none"
-                now_ts = time.time()
-                if (not force) and done == reporter_meta["last_done"]:
-                    return
-                reporter_meta["last_sig"] = sig
-                reporter_meta["last_emit_ts"] = now_ts
-                reporter_meta["last_done"] = done
-                log(
-                    f"总进度 {done}/{total}（{done_pct:5.1f}%） | 成功 {ok} 失败 {fail} | "
-                    f"速度 {format_bytes(total_speed)}/s | 剩余 {format_duration(eta) if eta is not None else '--:--'}",
-                    "BATCH",
-                )
-                if force:
-                    log("Active: (none)", "BATCH")
-                return
-
-            active_sorted = sorted(active, key=lambda x: x[1].get("updated_at", 0), reverse=True)
+            total_dl = progress_state["total_downloaded"]
+            total_known = progress_state["total_known"]
+            active = sorted(progress_state["active"], key=task_updated_at.__getitem__, reverse=True)
+            total_speed = sum(task_speed[i] for i in active)
             limit = 5
-            count = len(active_sorted)
+            count = len(active)
             if count > limit:
                 offset = progress_state["offset"] % count
-                rolled = active_sorted[offset:] + active_sorted[:offset]
-                show = rolled[:limit]
+                show = (active[offset:] + active[:offset])[:limit]
                 progress_state["offset"] = (progress_state["offset"] + limit) % count
             else:
-                show = active_sorted
-
-            sig_parts = [f"{done}|{ok}|{fail}|{len(active_sorted)}"]
-            for kw, v in show:
-                sig_parts.append(
-                    f"{kw}|{int(v.get('downloaded') or 0)}|{int(v.get('total_size') or 0)}|{int(v.get('speed') or 0)}"
+                show = active
+            rows = [
+                (task_label[i], task_downloaded[i], task_total_size[i], task_speed[i], task_eta[i]) for i in show
+            ]
+
+        if (not active) and (not force) and done == reporter_meta["last_done"]:
+            return
+        reporter_meta["last_emit_ts"] = time.monotonic()
+        reporter_meta["last_done"] = done
+
+        remain_known = max(0, total_known - total_dl)
+        eta = remain_known / total_speed if total_speed > 1 and total_known > 0 else None
+        done_pct = (done * 100.0 / total) if total else 100.0
+        log(
+            f"总进度 {done}/{total}（{done_pct:5.1f}%） | 成功 {ok} 失败 {fail} | "
+            f"速度 {format_bytes(total_speed)}/s | 剩余 {format_duration(eta) if eta is not None else '--:--'}",
+            "BATCH",
+        )
+        if not active:
+            if force:
+                log("Active: (none)", "BATCH")
+            return
+
+        for label, dl, ts, spd, task_eta_value in rows:
+            if ts > 0:
+                pct = min(100.0, dl * 100.0 / ts)
+                eta_text = format_duration(task_eta_value) if task_eta_value is not None else "--:--"
+                log(
+                    f"{label[:36]} | {pct:5.1f}% | {format_bytes(dl)}/{format_bytes(ts)} | "
+                    f"{format_bytes(spd)}/s | ETA {eta_text}",
+                    "ACTV",
                 )
-            sig = ";".join(sig_parts)
-            now_ts = time.time()
-            if (not force) and sig == reporter_meta["last_sig"] and (now_ts - reporter_meta["last_emit_ts"] < 4.0):
-                return
-            reporter_meta["last_sig"] = sig
-            reporter_meta["last_emit_ts"] = now_ts
-            reporter_meta["last_done"] = done
-            log(
-                f"总进度 {done}/{total}（{done_pct:5.1f}%） | 成功 {ok} 失败 {fail} | "
-                f"速度 {format_bytes(total_speed)}/s | 剩余 {format_duration(eta) if eta is not None else '--:--'}",
-                "BATCH",
-            )
-
-            for kw, v in show:
-                dl = int(v.get("downloaded") or 0)
-                ts = int(v.get("total_size") or 0)
-                spd = float(v.get("speed") or 0.0)
-                if ts > 0:
-                    pct = min(100.0, dl * 100.0 / ts)
-                    eta_text = format_duration(v.get("eta")) if v.get("eta") is not None else "--:--"
-                    log(
-                        f"{(v.get('label') or kw)[:36]} | {pct:5.1f}% | {format_bytes(dl)}/{format_bytes(ts)} | "
-                        f"{format_bytes(spd)}/s | ETA {eta_text}",
-                        "ACTV",
-                    )
-                else:
-                    log(
-                        f"{(v.get('label') or kw)[:36]} | {format_bytes(dl)} | {format_bytes(spd)}/s | ETA --:--",
-                        "ACTV",
-                    )
+            else:
+                log(f"{label[:36]} | {format_bytes(dl)} | {format_bytes(spd)}/s | ETA --:--", "ACTV")
 
     def progress_reporter():
         while not stop_event.wait(1.5):
             render_batch_progress(force=False)
 
+    report_progress = (not only_get_link) and len(keywords) > 1
     reporter_thread = None
-    if (not only_get_link) and len(keywords) > 1:
+    if report_progress and not use_async:
         reporter_thread = threading.Thread(target=progress_reporter, daemon=True)
         reporter_thread.start()
 
     single_mode = len(keywords) == 1
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
-        def _task(kw):
-            hook = (lambda payload, _kw=kw: on_progress(_kw, payload)) if (not only_get_link and len(keywords) > 1) else None
-            return run_one_task(appid, kw, timeout, retries, only_get_link, out_dir, progress_hook=hook)
-
-        future_map = {executor.submit(_task, kw): kw for kw in keywords}
-        for future in concurrent.futures.as_completed(future_map):
-            kw = future_map[future]
-            res = future.result()
-            results.append(res)
-            with progress_lock:
-                progress_state["completed"] += 1
-                if res.get("ok"):
-                    progress_state["success"] += 1
-                    progress_state["tasks"][kw]["phase"] = "done"
-                else:
-                    progress_state["failed"] += 1
-                    progress_state["tasks"][kw]["phase"] = "failed"
-                progress_state["tasks"][kw]["updated_at"] = time.time()
-            if res["ok"]:
-                if single_mode and res.get("workshop_url"):
-                    log(f"{kw} | Workshop: {res['workshop_url']}", "WORKSHOP")
-                if only_get_link:
-                    log(f"{kw} -> {res['url']}", "URL")
-                else:
-                    log(f"{kw} -> {res['file']}", "DONE")
+    # asyncio 模式下 aiohttp 连接器自带 DNS 缓存（ttl_dns_cache），无需预热
+    if workers > 1 and not use_async:
+        prewarm_dns([CATALOG_BASE, MODSBASE_BASE] + ([STEAM_WORKSHOP_BASE, STEAMWORKSHOP_DL_HOME] if appid else []))
+
+    def hook_for(kw):
+        if only_get_link or len(keywords) <= 1:
+            return None
+        return lambda payload: on_progress(kw, payload)
+
+    def on_result(kw, res):
+        results.append(res)
+        idx = task_index[kw]
+        ok = bool(res.get("ok"))
+        phase = TASK_PHASES["done"] if ok else TASK_PHASES["failed"]
+        now = time.time()
+        with progress_lock:
+            progress_state["completed"] += 1
+            progress_state["success" if ok else "failed"] += 1
+            task_phase[idx] = phase
+            task_updated_at[idx] = now
+            progress_state["active"].discard(idx)
+        if res["ok"]:
+            if single_mode and res.get("workshop_url"):
+                log(f"{kw} | Workshop: {res['workshop_url']}", "WORKSHOP")
+            if only_get_link:
+                log(f"{kw} -> {res['url']}", "URL")
             else:
-                log(f"{kw} -> {res['error']}", "WARN")
+                log(f"{kw} -> {res['file']}", "DONE")
+        else:
+            log(f"{kw} -> {res['error']}", "WARN")
+
+    if use_async:
+        asyncio.run(
+            run_tasks_async(
+                appid,
+                keywords,
+                timeout,
+                retries,
+                only_get_link,
+                out_dir,
+                workers,
+                hook_for,
+                on_result,
+                report=render_batch_progress if report_progress else None,
+                lookup_cache=lookup_cache,
+            )
+        )
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            future_map = {
+                executor.submit(
+                    run_one_task,
+                    appid,
+                    kw,
+                    timeout,
+                    retries,
+                    only_get_link,
+                    out_dir,
+                    progress_hook=hook_for(kw),
+                    lookup_cache=lookup_cache,
+                ): kw
+                for kw in keywords
+            }
+            for future in iter_completed(future_map):
+                on_result(future_map[future], future.result())
 
     if reporter_thread:
         stop_event.set()
         reporter_thread.join(timeout=2.0)
+    if report_progress:
         render_batch_progress(force=True)
 
     success = sum(1 for x in results if x["ok"])
@@ -892,16 +1787,16 @@ def run_batch(selected_game, keywords, only_get_link, out_dir, timeout, retries,
         out_dir.mkdir(parents=True, exist_ok=True)
         mapping_name = f"workshop_mapping_{time.strftime('%Y%m%d_%H%M%S')}.txt"
         mapping_path = out_dir / mapping_name
+        lines = ["keyword\tworkshop_url\ttitle\tdirect_url\tstatus\terror"]
+        for row in results:
+            status = "ok" if row.get("ok") else "failed"
+            lines.append(
+                f"{_tsv(row.get('keyword'))}\t{_tsv(row.get('workshop_url'))}\t{_tsv(row.get('title'))}\t"
+                f"{_tsv(row.get('url'))}\t{status}\t{_tsv(row.get('error'))}"
+            )
+        lines.append("")
         with open(mapping_path, "w", encoding="utf-8") as f:
-            f.write("keyword\tworkshop_url\ttitle\tdirect_url\tstatus\terror\n")
-            for row in results:
-                keyword = (row.get("keyword") or "").replace("\t", " ").replace("\n", " ").strip()
-                workshop_url = (row.get("workshop_url") or "").replace("\t", " ").strip()
-                title = (row.get("title") or "").replace("\t", " ").replace("\n", " ").strip()
-                direct_url = (row.get("url") or "").replace("\t", " ").strip()
-                status = "ok" if row.get("ok") else "failed"
-                error = (row.get("error") or "").replace("\t", " ").replace("\n", " ").strip()
-                f.write(f"{keyword}\t{workshop_url}\t{title}\t{direct_url}\t{status}\t{error}\n")
+            f.write("\n".join(lines))
         log(f"Batch mapping saved: {mapping_path}", "INFO")
 
     return results
@@ -909,15 +1804,15 @@ def run_batch(selected_game, keywords, only_get_link, out_dir, timeout, retries,
 
 def split_game_names(game_name: str, aliases=None):
     aliases = aliases or []
-    chinese_parts = re.findall(r"[\u4e00-\u9fff]+", game_name or "")
+    chinese_parts = _RE_CJK_RUN.findall(game_name or "")
     chinese_name = " ".join(chinese_parts).strip()
 
-    english_name = re.sub(r"[\u4e00-\u9fff]+", " ", game_name or "")
-    english_name = re.sub(r"\s+", " ", english_name).strip()
+    english_name = _RE_CJK_RUN.sub(" ", game_name or "")
+    english_name = " ".join(english_name.split())
 
     if not chinese_name:
         for a in aliases:
-            c = re.findall(r"[\u4e00-\u9fff]+", a or "")
+            c = _RE_CJK_RUN.findall(a or "")
             if c:
                 chinese_name = " ".join(c).strip()
                 break
@@ -931,63 +1826,67 @@ def split_game_names(game_name: str, aliases=None):
 def _extract_cn_from_text(text: str):
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
     # 优先提取括号中的中文名
-    for m in re.finditer(r"[（(]([^()（）]{1,40})[）)]", text):
+    for m in _RE_PAREN_NAME.finditer(text):
         candidate = m.group(1).strip()
-        if re.search(r"[\u4e00-\u9fff]", candidate):
-            candidate = re.sub(r"[^0-9A-Za-z\u4e00-\u9fff·\- ]+", "", candidate).strip()
+        if _RE_CJK_CHAR.search(candidate):
+            # 多数候选本就不含需剔除的字符，先 search 判断，避免无谓地重建字符串
+            if _RE_CN_NAME_JUNK.search(candidate):
+                candidate = _RE_CN_NAME_JUNK.sub("", candidate).strip()
             if len(candidate) >= 2:
                 return candidate
     # 其次提取纯中文片段
-    parts = re.findall(r"[\u4e00-\u9fff]{2,}", text)
+    parts = _RE_CJK_WORD.findall(text)
     if parts:
         return parts[0]
     return ""
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_good_cn_name(candidate: str):
     if not candidate:
         return False
     c = candidate.strip()
     if len(c) < 2 or len(c) > 20:
         return False
-    bad_terms = [
-        "美国东部时间",
-        "东部时间",
-        "太平洋时间",
-        "协调世界时",
-        "维基百科",
-        "百科",
-        "官方网站",
-        "官网",
-        "Steam",
-        "steam",
-        "以下简称",
-        "来源",
-        "中文",
-        "正好",
-        "打到",
-        "为什么",
-        "事件",
-        "教程",
-        "攻略",
-        "下载",
-        "视频",
-        "新闻",
-    ]
-    for w in bad_terms:
-        if w in c:
-            return False
-    sentence_like = ["为什么", "如何", "怎么", "事件", "坍塌", "介绍", "攻略", "下载", "视频", "新闻", "问题", "可以", "支持", "包括"]
-    if any(w in c for w in sentence_like):
+    if _RE_CN_BAD_TERM.search(c) or _RE_CN_SENTENCE_LIKE.search(c):
         return False
-    if re.search(r"[A-Za-z]{2,}", c):
+    if _RE_LATIN2.search(c):
         return False
-    return bool(re.search(r"[\u4e00-\u9fff]", c))
+    return bool(_RE_CJK_CHAR.search(c))
+
 
+@functools.lru_cache(maxsize=256)
+def _cn_near_en_patterns(game_en: str):
+    # 英文名紧邻括号中文名的两种写法；同一游戏的多次查询复用编译结果
+    escaped = re.escape(game_en)
+    return (
+        re.compile(escaped + r".{0,20}[（(]([^()（）]{1,20})[）)]", re.I),
+        re.compile(r"[（(]([^()（）]{1,20})[）)].{0,20}" + escaped, re.I),
+    )
 
-def search_cn_name_from_web(opener, game_en: str, timeout: int, retries: int):
+
+def _iter_bing_chunks(html_text: str, limit: int = 8):
+    # 用 str.find 逐条切出搜索结果并去标签，最多 limit 条；惰性生成，命中后不再处理后续结果
+    pos = 0
+    count = 0
+    while count < limit:
+        start = html_text.find('<li class="b_algo"', pos)
+        if start < 0:
+            return
+        end = html_text.find("</li>", start)
+        if end < 0:
+            return
+        pos = end + 5
+        plain = _RE_TAG.sub(" ", html_text[start:pos])
+        plain = html.unescape(" ".join(plain.split())).strip()
+        if plain:
+            count += 1
+            yield plain
+
+
+def search_cn_name_from_web(session, game_en: str, timeout: int, retries: int):
     if not game_en:
         return ""
 
@@ -997,25 +1896,20 @@ def search_cn_name_from_web(opener, game_en: str, timeout: int, retries: int):
         f"\"{game_en}\" 中文名 游戏",
     ]
 
+    after_en, before_en = _cn_near_en_patterns(game_en)
+    en_lower = game_en.lower()
     for q in queries:
         query = urllib.parse.quote(q)
         url = f"https://www.bing.com/search?q={query}&setlang=zh-hans"
-        html_text = http_get(opener, url, timeout, default_headers(), retries=retries)
-        chunks = []
-        for m in re.finditer(r"<li class=\"b_algo\".*?</li>", html_text, re.I | re.S):
-            block = m.group(0)
-            plain = re.sub(r"<.*?>", " ", block)
-            plain = html.unescape(re.sub(r"\s+", " ", plain)).strip()
-            if plain:
-                chunks.append(plain)
-        for c in chunks[:8]:
-            if game_en.lower() in c.lower():
-                m1 = re.search(re.escape(game_en) + r".{0,20}[（(]([^()（）]{1,20})[）)]", c, re.I)
+        html_text = http_get(session, url, timeout, default_headers(), retries=retries)
+        for c in _iter_bing_chunks(html_text):
+            if en_lower in c.lower():
+                m1 = after_en.search(c)
                 if m1:
                     cn = m1.group(1).strip()
                     if _is_good_cn_name(cn):
                         return cn
-                m2 = re.search(r"[（(]([^()（）]{1,20})[）)].{0,20}" + re.escape(game_en), c, re.I)
+                m2 = before_en.search(c)
                 if m2:
                     cn = m2.group(1).strip()
                     if _is_good_cn_name(cn):
@@ -1023,34 +1917,62 @@ def search_cn_name_from_web(opener, game_en: str, timeout: int, retries: int):
     return ""
 
 
-def translate_cn_fallback(opener, game_en: str, timeout: int, retries: int):
+TRANSLATE_BATCH_SIZE = 20
+
+
+def _translate_text(session, text: str, timeout: int, retries: int):
+    q = urllib.parse.quote(text)
+    url = f"https://translate.googleapis.com/translate_a/single?client=gtx&sl=auto&tl=zh-CN&dt=t&q={q}"
+    raw = http_get(session, url, timeout, default_headers(), retries=retries)
+    data = json.loads(raw)
+    if isinstance(data, list) and data and isinstance(data[0], list):
+        return "".join(x[0] for x in data[0] if isinstance(x, list) and x and x[0])
+    return ""
+
+
+def translate_cn_fallback(session, game_en: str, timeout: int, retries: int):
     if not game_en:
         return ""
-    q = urllib.parse.quote(game_en)
-    url = f"https://translate.googleapis.com/translate_a/single?client=gtx&sl=auto&tl=zh-CN&dt=t&q={q}"
     try:
-        raw = http_get(opener, url, timeout, default_headers(), retries=retries)
-        data = json.loads(raw)
-        if isinstance(data, list) and data and isinstance(data[0], list):
-            text = "".join(x[0] for x in data[0] if isinstance(x, list) and x and x[0])
-            text = text.strip()
-            if _is_good_cn_name(text):
-                return text
+        text = _translate_text(session, game_en, timeout, retries).strip()
+        if _is_good_cn_name(text):
+            return text
     except Exception:
         return ""
     return ""
 
 
-def resolve_cn_name(opener, game_en: str, timeout: int, retries: int, cache_obj: dict):
+def translate_cn_fallback_batch(session, names, timeout: int, retries: int):
+    """多个英文名按行拼接后一次请求翻译，返回与 names 一一对应的结果列表。
+
+    返回行数对不上或请求失败时，逐条回退到 translate_cn_fallback。
+    """
+    names = [" ".join((n or "").split()) for n in names]
+    if len(names) <= 1:
+        return [translate_cn_fallback(session, n, timeout, retries) for n in names]
+    try:
+        lines = _translate_text(session, "\n".join(names), timeout, retries).split("\n")
+    except Exception:
+        lines = []
+    if len(lines) != len(names):
+        return [translate_cn_fallback(session, n, timeout, retries) for n in names]
+    out = []
+    for name, line in zip(names, lines):
+        text = line.strip()
+        out.append(text if name and _is_good_cn_name(text) else "")
+    return out
+
+
+def resolve_cn_name(session, game_en: str, timeout: int, retries: int, cache_obj: dict):
     key = (game_en or "").strip().lower()
     if not key:
         return ""
     if key in cache_obj and _is_good_cn_name(cache_obj[key]):
         return cache_obj[key]
 
-    cn = search_cn_name_from_web(opener, game_en, timeout, retries)
+    cn = search_cn_name_from_web(session, game_en, timeout, retries)
     if not _is_good_cn_name(cn):
-        cn = translate_cn_fallback(opener, game_en, timeout, retries)
+        cn = translate_cn_fallback(session, game_en, timeout, retries)
     cache_obj[key] = cn if _is_good_cn_name(cn) else ""
     return cache_obj[key]
 
@@ -1058,73 +1980,101 @@ def resolve_cn_name(opener, game_en: str, timeout: int, retries: int, cache_obj:
 def prefill_cn_cache(games, timeout: int, retries: int, workers: int = 8):
     cache_obj = load_name_cache()
     lock = threading.Lock()
+    # 已发起过网络查询的英文名 -> 共用这次查询的游戏数；别名重叠的游戏不再重复请求 Bing/翻译，
+    # 查询有结果时按游戏数一并计入 have_cn
+    pending = {}
+    # 第一阶段网页搜索未命中的英文名，第二阶段批量翻译
+    misses = []
 
     def _work(game_item):
-        english_name, chinese_name = split_game_names(game_item.get("Game", ""), game_item.get("Aliases", []))
+        # 返回因本次调用而确认有中文名的游戏数
+        # load_games 已由 prepare_games 预先拆分好中英文名
+        english_name, chinese_name = game_item["_en"], game_item["_cn"]
         key = english_name.strip().lower()
         if key and _is_good_cn_name(cache_obj.get(key, "")):
-            return True
+            return 1
         if chinese_name:
-            with lock:
-                cache_obj[key] = chinese_name
-            return True
-        opener = new_opener()
-        cn = resolve_cn_name(opener, english_name, timeout, retries, cache_obj={})
+            if cache_obj.get(key) != chinese_name:
+                with lock:
+                    cache_obj[key] = chinese_name
+                mark_name_cache_dirty()
+            return 1
+        if not key:
+            return 0
         with lock:
-            cache_obj[key] = cn or ""
-        return bool(cn)
-
+            if _is_good_cn_name(cache_obj.get(key, "")):
+                return 1
+            if key in pending:
+                # 同名查询进行中或已判定未命中，由首个查询的结果统一计数
+                pending[key] += 1
+                return 0
+            pending[key] = 1
+        session = thread_session()
+        cn = search_cn_name_from_web(session, english_name, timeout, retries)
+        with lock:
+            if not _is_good_cn_name(cn):
+                misses.append(english_name)
+                return 0
+            cache_obj[key] = cn
+            hit = pending[key]
+        mark_name_cache_dirty()
+        return hit
+
+    def _translate_batch(batch):
+        cns = translate_cn_fallback_batch(thread_session(), batch, timeout, retries)
+        hit = 0
+        for english_name, cn in zip(batch, cns):
+            key = english_name.strip().lower()
+            cache_obj[key] = cn
+            if cn:
+                hit += pending[key]
+        mark_name_cache_dirty()
+        return hit
+
+    ok = 0
     with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
         futures = [executor.submit(_work, g) for g in games]
         done = 0
-        ok = 0
         total = len(futures)
-        for f in concurrent.futures.as_completed(futures):
+        for f in iter_completed(futures):
             done += 1
             try:
-                if f.result():
-                    ok += 1
+                ok += f.result()
             except Exception:
                 pass
             if done % 20 == 0 or done == total:
                 log(f"Prefill progress: {done}/{total} (have_cn={ok})", "INFO")
-                save_name_cache(cache_obj)
 
-    save_name_cache(cache_obj)
+        batches = [misses[i : i + TRANSLATE_BATCH_SIZE] for i in range(0, len(misses), TRANSLATE_BATCH_SIZE)]
+        if batches:
+            log(f"Translating {len(misses)} names in {len(batches)} batches...", "STEP")
+        for f in iter_completed([executor.submit(_translate_batch, b) for b in batches]):
+            try:
+                ok += f.result()
+            except Exception:
+                pass
+        if batches:
+            log(f"Translate fallback done (have_cn={ok})", "INFO")
+
+    flush_name_cache()
+    _is_good_cn_name.cache_clear()
     log(f"CN cache saved: {ZH_NAME_CACHE_PATH} (count={len(cache_obj)})", "OK")
 
 
-def _match_game(item, search_text: str):
+def filter_games(games, search_text: str):
+    # 查询相关的判断只做一次，循环内只剩一次子串查找
     if not search_text:
-        return True
-
-    query_has_cn = bool(re.search(r"[\u4e00-\u9fff]", search_text))
+        return list(games)
+    if _RE_CJK_CHAR.search(search_text):
+        return [g for g in games if search_text in g["_cn_blob"]]
+    # 词前缀匹配必然也是 _en_blob 的子串，单次 in 已覆盖，无需再逐词 startswith
     q = search_text.strip().lower()
-
-    english_name, chinese_name = split_game_names(item.get("Game", ""), item.get("Aliases", []))
-    slug = urllib.parse.unquote(item.get("Slug", "")).lower()
-    aliases = [str(a).lower() for a in item.get("Aliases", [])]
-
-    if query_has_cn:
-        target_cn = (chinese_name + " " + " ".join(item.get("Aliases", []))).strip()
-        return search_text in target_cn
-
-    english_blob = (english_name + " " + slug + " " + " ".join(aliases)).lower()
-    if q in english_blob:
-        return True
-
-    english_tokens = re.split(r"[^a-z0-9]+", english_blob)
-    english_tokens = [t for t in english_tokens if t]
-    return any(token.startswith(q) for token in english_tokens)
-
-
-def filter_games(games, search_text: str):
-    return [g for g in games if _match_game(g, search_text)]
+    return [g for g in games if q in g["_en_blob"]]
 
 
 def interactive_pick_game(games, cfg):
     while True:
-        game_kw = input("请输入游戏关键词筛选（中英文均可，留空=全局）: ").strip()
+        game_kw = prompt("请输入游戏关键词筛选（中英文均可，留空=全局）: ").strip()
         if not game_kw:
             return None
 
@@ -1141,7 +2091,7 @@ def interactive_pick_game(games, cfg):
             retries=cfg["retries"],
             auto_fill_cn=False,
         )
-        app_text = input("请输入 AppId（R=重新搜索，回车=全局）: ").strip()
+        app_text = prompt("请输入 AppId（R=重新搜索，回车=全局）: ").strip()
         if not app_text:
             return None
         if app_text.lower() == "r":
@@ -1152,47 +2102,52 @@ def interactive_pick_game(games, cfg):
 
 
 def print_games(games, limit=0, search="", timeout=25, retries=1, auto_fill_cn=True):
-    sorted_games = sorted(games, key=lambda x: (x.get("Game", ""), int(x.get("AppId", 0))))
-    if search:
-        sorted_games = [x for x in sorted_games if _match_game(x, search)]
+    # 先筛选再排序，只对命中的少量游戏排序
+    matched = filter_games(games, search) if search else games
+    sorted_games = sorted(matched, key=operator.itemgetter("_sort_key"))
     if limit > 0:
         sorted_games = sorted_games[:limit]
 
-    print(f"{'AppId':<8} {'Game':<45} 中文名")
-    print(f"{'-'*8} {'-'*45} {'-'*20}")
-    opener = new_opener() if auto_fill_cn else None
+    echo(f"{'AppId':<8} {'Game':<45} 中文名")
+    echo(f"{'-'*8} {'-'*45} {'-'*20}")
+    session = new_session() if auto_fill_cn else None
     name_cache = load_name_cache() if auto_fill_cn else {}
     for g in sorted_games:
-        english_name, chinese_name = split_game_names(g.get("Game", ""), g.get("Aliases", []))
+        english_name, chinese_name = g["_en"], g["_cn"]
         if auto_fill_cn and not chinese_name:
-            chinese_name = resolve_cn_name(opener, english_name, timeout, retries, name_cache)
-        print(f"{g['AppId']:<8} {english_name:<45} {chinese_name}")
+            # 只有缓存内容真正变化时才计入待写入，命中缓存的列表展示不会触发写盘
+            key = english_name.strip().lower()
+            before = name_cache.get(key)
+            chinese_name = resolve_cn_name(session, english_name, timeout, retries, name_cache)
+            if name_cache.get(key) != before:
+                mark_name_cache_dirty()
+        echo(f"{g['AppId']:<8} {english_name:<45} {chinese_name}")
     if auto_fill_cn:
-        save_name_cache(name_cache)
+        flush_name_cache()
 
 
 def show_banner():
-    print(BANNER_ART)
-    print("-" * 78)
-    print("本程序仅用于学习交流，请遵守相关平台规则与法律。")
-    print(f"提示：{EXACT_SEARCH_NOTICE}")
-    print()
+    echo(BANNER_ART)
+    echo("-" * 78)
+    echo("本程序仅用于学习交流，请遵守相关平台规则与法律。")
+    echo(f"提示：{EXACT_SEARCH_NOTICE}")
+    echo()
 
 
 def menu_loop(cfg):
     while True:
         show_banner()
-        print(f"当前下载目录: {cfg['download_dir']}")
-        print(f"当前线程数: {cfg['workers']} | 超时: {cfg['timeout']}秒 | 重试: {cfg['retries']}次")
-        print("1. 单条下载（可全局）")
-        print("2. 单条仅解析直链（可全局）")
-        print("3. 批量下载（可全局，文件一行一个关键词）")
-        print("4. 批量仅解析直链（可全局）")
-        print("5. 列出支持游戏")
-        print("6. 刷新支持游戏缓存")
-        print("7. 设置")
-        print("8. 退出")
-        choice = input("请输入选项编号: ").strip()
+        echo(f"当前下载目录: {cfg['download_dir']}")
+        echo(f"当前线程数: {cfg['workers']} | 超时: {cfg['timeout']}秒 | 重试: {cfg['retries']}次")
+        echo("1. 单条下载（可全局）")
+        echo("2. 单条仅解析直链（可全局）")
+        echo("3. 批量下载（可全局，文件一行一个关键词）")
+        echo("4. 批量仅解析直链（可全局）")
+        echo("5. 列出支持游戏")
+        echo("6. 刷新支持游戏缓存")
+        echo("7. 设置")
+        echo("8. 退出")
+        choice = prompt("请输入选项编号: ").strip()
 
         if choice == "8":
             break
@@ -1204,10 +2159,10 @@ def menu_loop(cfg):
 
                 only_link = choice in {"2", "4"}
                 if choice in {"1", "2"}:
-                    keyword = input("请输入创意工坊项目关键词: ").strip()
+                    keyword = prompt("请输入创意工坊项目关键词: ").strip()
                     keywords = get_keywords(keyword=keyword)
                 else:
-                    list_file = input("请输入项目关键词文件路径（每行一个关键词）: ").strip()
+                    list_file = prompt("请输入项目关键词文件路径（每行一个关键词）: ").strip()
                     keywords = get_keywords(list_file=list_file)
 
                 run_batch(
@@ -1218,36 +2173,37 @@ def menu_loop(cfg):
                     timeout=int(cfg["timeout"]),
                     retries=int(cfg["retries"]),
                     workers=int(cfg["workers"]),
+                    use_async=bool(cfg.get("async_io")),
                 )
-                input("\n回车继续...")
+                prompt("\n回车继续...")
             elif choice == "5":
                 games = load_games(cfg["timeout"], cfg.get("refresh_games_cache", False), cfg["retries"])
-                q = input("输入关键词筛选（中英文均可，留空显示全部）: ").strip()
+                q = prompt("输入关键词筛选（中英文均可，留空显示全部）: ").strip()
                 print_games(games, search=q, timeout=cfg["timeout"], retries=cfg["retries"], auto_fill_cn=True)
-                input("\n回车继续...")
+                prompt("\n回车继续...")
             elif choice == "6":
                 fetch_supported_games(cfg["timeout"], retries=cfg["retries"])
-                input("\n回车继续...")
+                prompt("\n回车继续...")
             elif choice == "7":
-                print("1) 下载目录  2) 线程数  3) 超时  4) 重试次数  5) 返回")
-                sub = input("请选择设置项: ").strip()
+                echo("1) 下载目录  2) 线程数  3) 超时  4) 重试次数  5) 返回")
+                sub = prompt("请选择设置项: ").strip()
                 if sub == "1":
-                    v = input("请输入下载目录（留空取消）: ").strip()
+                    v = prompt("请输入下载目录（留空取消）: ").strip()
                     if v:
                         cfg["download_dir"] = v
                         save_config(cfg)
                 elif sub == "2":
-                    v = input("请输入线程数(1-16): ").strip()
+                    v = prompt(f"请输入线程数(1-{MAX_WORKERS}): ").strip()
                     if v.isdigit():
-                        cfg["workers"] = max(1, min(16, int(v)))
+                        cfg["workers"] = max(1, min(MAX_WORKERS, int(v)))
                         save_config(cfg)
                 elif sub == "3":
-                    v = input("请输入超时秒数(5-180): ").strip()
+                    v = prompt("请输入超时秒数(5-180): ").strip()
                     if v.isdigit():
                         cfg["timeout"] = max(5, min(180, int(v)))
                         save_config(cfg)
                 elif sub == "4":
-                    v = input("请输入重试次数(0-10): ").strip()
+                    v = prompt("请输入重试次数(0-10): ").strip()
                     if v.isdigit():
                         cfg["retries"] = max(0, min(10, int(v)))
                         save_config(cfg)
@@ -1256,7 +2212,7 @@ def menu_loop(cfg):
                 time.sleep(1)
         except Exception as e:
             log(str(e), "ERR")
-            input("\n回车继续...")
+            prompt("\n回车继续...")
 
 
 def build_arg_parser():
@@ -1279,6 +2235,8 @@ def build_arg_parser():
     parser.add_argument("--only-get-link", action="store_true", help="Resolve direct links only")
     parser.add_argument("--no-cn-fill", action="store_true", help="Disable web+translation CN-name fill for game list")
     parser.add_argument("--limit", type=int, default=0, help="Limit keyword count")
+    parser.add_argument("--async-io", action="store_true", help="Run batch tasks on asyncio + aiohttp")
+    parser.add_argument("--no-cache", action="store_true", help="Do not reuse Steam/catalogue lookups within a batch")
     return parser
 
 
@@ -1289,16 +2247,19 @@ def main():
         log(f"已创建数据目录: {DATA_DIR}", "INFO")
     cfg = load_config()
     parser = build_arg_parser()
+    flush_log()
     args = parser.parse_args()
 
     if args.workers:
-        cfg["workers"] = max(1, min(16, int(args.workers)))
+        cfg["workers"] = max(1, min(MAX_WORKERS, int(args.workers)))
     if args.timeout:
         cfg["timeout"] = max(5, min(180, int(args.timeout)))
     if args.retries is not None:
         cfg["retries"] = max(0, min(10, int(args.retries)))
     if args.out_dir:
         cfg["download_dir"] = args.out_dir
+    if args.async_io:
+        cfg["async_io"] = True
 
     has_action_args = any(
         [
@@ -1361,6 +2322,8 @@ def main():
         timeout=int(cfg["timeout"]),
         retries=int(cfg["retries"]),
         workers=int(cfg["workers"]),
+        use_async=bool(cfg.get("async_io")),
+        use_cache=not args.no_cache,
     )
 
 